@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import time
+
+import httpx
+from openseapy import Client
+
+from .stub_server import start
+
+N = 2000
+
+
+async def per_call_client(url):
+    async with httpx.AsyncClient() as client:
+        return await client.get(url)
+
+
+async def bench(name, get):
+    start_ = time.perf_counter()
+    for _ in range(N):
+        await get()
+    elapsed = time.perf_counter() - start_
+
+    print(f"{name:<20} {elapsed / N * 1e6:8.1f} us/request")
+
+
+async def amain():
+    server, url = await start()
+    url = f"{url}/api/v2/collections/stub"
+
+    await bench("client per call", lambda: per_call_client(url))
+
+    client = Client()
+    await bench("pooled client", lambda: client.get(url))
+    await client.aclose()
+
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(amain())
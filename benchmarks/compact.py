@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+import gc
+import json
+import tracemalloc
+
+from openseapy.models.compact import CompactEvent
+from openseapy.models.stream import Message
+
+from .frames import frames
+
+N = 20000
+
+
+def retained(f, raw):
+    gc.collect()
+    tracemalloc.start()
+    # frames are decoded one by one, only the events are kept alive
+    events = [f(json.loads(frame)) for frame in raw]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del events
+    return size
+
+
+if __name__ == "__main__":
+    raw = frames(N)
+
+    for name, f in (
+        ("Message", Message.decode),
+        ("CompactEvent", CompactEvent.from_frame),
+    ):
+        size = retained(f, raw)
+        print(f"{name:<13} {size / N:8.0f} bytes/event")
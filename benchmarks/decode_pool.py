@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import os
+import time
+
+from openseapy import DecodePool
+from openseapy.models.stream import Message
+from openseapy.utils import jsonlib
+
+from .frames import frames
+
+N = 50000
+
+
+async def single_loop(raw):
+    for frame in raw:
+        Message.decode(jsonlib.loads(frame))
+
+
+async def pool(raw):
+    decoded = 0
+
+    async def on_events(events, filtered):
+        nonlocal decoded
+        decoded += len(events)
+
+    pool = DecodePool(batch_size=512, max_inflight=2 * (os.cpu_count() or 1))
+    pool.start(on_events)
+    for frame in raw:
+        await pool.put(frame)
+    await pool.join()
+    await pool.stop()
+
+    assert decoded == len(raw)
+
+
+async def amain():
+    raw = frames(N)
+
+    for f in (single_loop, pool):
+        wall, cpu = time.perf_counter(), time.process_time()
+        await f(raw)
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+        # cpu is the time the event loop process was busy
+        print(f"{f.__name__:<12} {N / wall:9.0f} frames/s, loop cpu {cpu:6.2f} s")
+
+
+if __name__ == "__main__":
+    asyncio.run(amain())
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+import json
+import time
+
+from openseapy import EventFilter
+from openseapy.models.stream import Message
+
+from .frames import frames
+
+N = 20000
+
+
+def timed(f, raw):
+    start = time.perf_counter()
+    for msg in raw:
+        f(msg)
+
+    return (time.perf_counter() - start) / len(raw)
+
+
+if __name__ == "__main__":
+    # 100 slugs, we are only interested in one of them
+    raw = [json.loads(frame) for frame in frames(N, slugs=100)]
+    f = EventFilter(slugs=["stub-0"])
+
+    filter_time = timed(f, raw)
+    decode_time = timed(Message.decode, raw)
+    kept = sum(map(f, raw))
+
+    print(f"filter {filter_time * 1e6:6.2f} us/event")
+    print(f"decode {decode_time * 1e6:6.2f} us/event")
+    print(f"kept {kept}/{N}, saved {(N - kept) * (decode_time - filter_time):.3f} s")
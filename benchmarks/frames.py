@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import json
+
+ITEM_LISTED = {
+    "event": "item_listed",
+    "topic": "collection:*",
+    "ref": None,
+    "payload": {
+        "event_type": "item_listed",
+        "sent_at": "2023-11-01T12:00:00.000000+00:00",
+        "payload": {
+            "collection": {"slug": "stub"},
+            "event_timestamp": "2023-11-01T12:00:00.000000+00:00",
+            "item": {
+                "chain": {"name": "ethereum"},
+                "metadata": {
+                    "animation_url": None,
+                    "image_url": "https://i.seadn.io/stub.png",
+                    "metadata_url": "ipfs://stub/1234",
+                    "name": "Stub #1234",
+                },
+                "nft_id": "ethereum/0x495f947276749ce646f68ac8c248420045cb7b5e/1234",
+                "permalink": "https://opensea.io/assets/ethereum/0x495f/1234",
+            },
+            "base_price": "1250000000000000000",
+            "payment_token": {
+                "address": "0x0000000000000000000000000000000000000000",
+                "decimals": 18,
+                "eth_price": "1.000000000000000",
+                "name": "Ether",
+                "symbol": "ETH",
+                "usd_price": "1800.000000000000000000",
+            },
+            "quantity": 1,
+            "expiration_date": "2023-12-01T12:00:00.000000+00:00",
+            "listing_type": None,
+            "listing_date": "2023-11-01T12:00:00.000000+00:00",
+            "is_private": False,
+            "maker": {"address": "0x2066ab6aa45120e5db70ab618b58ae126b0cbe04"},
+            "taker": None,
+        },
+    },
+}
+
+
+def frames(n, slugs=100):
+    # json frames with varying slugs and token ids, like on a firehose
+    res = []
+    for i in range(n):
+        frame = json.loads(json.dumps(ITEM_LISTED))
+        payload = frame["payload"]["payload"]
+        payload["collection"]["slug"] = f"stub-{i % slugs}"
+        payload["item"]["nft_id"] = payload["item"]["nft_id"].replace("1234", str(i))
+        res.append(json.dumps(frame))
+
+    return res
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import json
+import timeit
+
+from openseapy.utils import jsonlib
+
+from .frames import ITEM_LISTED, frames
+
+N = 10000
+
+
+def bench(name):
+    jsonlib.set_backend(name)
+    raw = frames(N)
+
+    def decode():
+        for frame in raw:
+            jsonlib.loads(frame)
+
+    def encode():
+        for _ in range(N):
+            jsonlib.dumps(ITEM_LISTED)
+
+    for f in (decode, encode):
+        runs, total = timeit.Timer(f).autorange()
+        print(f"{name:<8} {f.__name__:<8} {total / runs / N * 1e6:6.2f} us/frame")
+
+
+if __name__ == "__main__":
+    print(f"frame size: {len(json.dumps(ITEM_LISTED))} bytes")
+    bench("json")
+    try:
+        bench("orjson")
+    except ValueError as e:
+        print(e)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import json
+import time
+
+from openseapy.models.stream import LazyMessage, Message
+
+from .frames import frames
+
+N = 20000
+
+
+def eager(raw):
+    payload = Message.decode(raw).payload
+    return payload.collection.slug, payload.base_price
+
+
+def lazy(raw):
+    payload = LazyMessage(raw).payload
+    return payload.collection.slug, payload.base_price
+
+
+if __name__ == "__main__":
+    raw = [json.loads(frame) for frame in frames(N)]
+
+    for f in (eager, lazy):
+        start = time.perf_counter()
+        for msg in raw:
+            f(msg)
+        elapsed = time.perf_counter() - start
+
+        print(f"{f.__name__:<6} {N / elapsed:10.0f} events/s")
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import json
+import timeit
+
+from openseapy.models.v2 import NFTs
+
+N = 200
+
+NFT = {
+    "identifier": "1234",
+    "collection": "stub",
+    "contract": "0x495f947276749ce646f68ac8c248420045cb7b5e",
+    "token_standard": "erc721",
+    "name": "Stub #1234",
+    "description": "A stub nft",
+    "image_url": "https://i.seadn.io/stub.png",
+    "metadata_url": "ipfs://stub/1234",
+    "opensea_url": "https://opensea.io/assets/ethereum/0x495f/1234",
+    "updated_at": "2023-11-01T12:00:00.000000",
+    "is_disabled": False,
+    "is_nsfw": False,
+}
+BODY = json.dumps({"nfts": [NFT] * N, "next": "cursor"}).encode()
+
+
+def decode_then_construct():
+    return NFTs(**json.loads(BODY))
+
+
+def validate_json():
+    return NFTs.model_validate_json(BODY)
+
+
+if __name__ == "__main__":
+    for f in (decode_then_construct, validate_json):
+        runs, total = timeit.Timer(f).autorange()
+        print(f"{f.__name__:<25} {total / runs * 1e3:8.3f} ms/page ({N} nfts)")
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+
+BODY = json.dumps({"nft": {"identifier": "1", "name": "stub"}, "next": None}).encode()
+
+
+async def _handle(reader, writer):
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if not head:
+                break
+
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n" % len(BODY) + BODY
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start(host="127.0.0.1", port=0):
+    server = await asyncio.start_server(_handle, host, port)
+    port = server.sockets[0].getsockname()[1]
+
+    return server, f"http://{host}:{port}"
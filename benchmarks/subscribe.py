@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+import time
+
+import websockets
+
+from openseapy.stream import OpenSeaStream
+
+N = 5000
+# simulated round trip of a join
+RTT = 0.005
+
+
+async def handler(ws):
+    async def reply(msg):
+        await asyncio.sleep(RTT)
+        payload = {"status": "ok", "response": {}}
+        await ws.send(json.dumps({**msg, "event": "phx_reply", "payload": payload}))
+
+    try:
+        async for msg in ws:
+            msg = json.loads(msg)
+            if msg["event"] == "phx_join":
+                asyncio.create_task(reply(msg))
+    except websockets.ConnectionClosed:
+        pass
+
+
+async def one_by_one(stream, slugs):
+    for slug in slugs:
+        await stream.subscribe([slug])
+
+
+async def pipelined(stream, slugs):
+    await stream.subscribe(slugs)
+
+
+async def amain():
+    async with websockets.serve(handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+
+        for f, n in ((one_by_one, N // 10), (pipelined, N)):
+            stream = OpenSeaStream("", test=True, log_level=None)
+            stream.url = f"ws://127.0.0.1:{port}"
+            await stream.start()
+
+            start = time.perf_counter()
+            await f(stream, [f"slug-{i}" for i in range(n)])
+            elapsed = time.perf_counter() - start
+
+            stats = stream.subscriptions.stats()
+            assert stats["joined"] == n
+            print(
+                f"{f.__name__:<12} {n / elapsed:9.0f} joins/s, "
+                f"latency {stats['latency'] * 1000:7.1f} ms"
+            )
+            await stream.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(amain())
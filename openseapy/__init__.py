@@ -1,4 +1,20 @@
-from .api import Chain  # noqa: F401
-from .helper import paginate  # noqa: F401
+from .api import Chain, Client, NFTResult  # noqa: F401
+from .backfill import backfill  # noqa: F401
+from .crawler import CollectionCrawler  # noqa: F401
+from .decode_pool import DecodePool  # noqa: F401
+from .dedup import Deduplicator  # noqa: F401
+from .dispatch import Dispatcher, Overflow, ShardedDispatcher  # noqa: F401
+from .filters import EventFilter  # noqa: F401
+from .gap_fill import GapFiller  # noqa: F401
+from .helper import PaginationStats, paginate  # noqa: F401
 from .opensea import OpenSea  # noqa: F401
-from .utils.rate_limiter import AsyncioRateLimiter, AsyncRedisRateLimiter  # noqa: F401
+from .subscriptions import Subscription, SubscriptionManager  # noqa: F401
+from .utils.cache import ResponseCache  # noqa: F401
+from .utils.rate_limiter import (  # noqa: F401
+    AdaptiveRateLimiter,
+    AsyncioRateLimiter,
+    AsyncRedisRateLimiter,
+    AsyncRedisSlidingWindowRateLimiter,
+    TokenBucketRateLimiter,
+)
+from .utils.retry import RetryPolicy  # noqa: F401
@@ -1,10 +1,17 @@
-from typing import List, Literal
+import asyncio
+import contextlib
+from typing import Iterable, List, Literal, NamedTuple
 
 import httpx
+from loguru import logger
 from urlpath import URL
 
 from .base import OpenSeaBase
+from .models import v2
+from .utils.cache import ResponseCache
 from .utils.rate_limiter import FakeRateLimiter, RateLimiter
+from .utils.retry import RetryPolicy
+from .utils.single_flight import SingleFlight
 
 Chain = Literal[
     "arbitrum",
@@ -40,23 +47,90 @@ EventType = Literal[
 ]
 
 
+class NFTResult(NamedTuple):
+    # (chain, contract_address, token_id)
+    identifier: tuple
+    response: httpx.Response | None
+    error: Exception | None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
 class Client:
+    def __init__(
+        self,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        timeout: float | httpx.Timeout = 5.0,
+        max_connections_per_host: int | None = None,
+        **client_kwargs,
+    ):
+        if limits is None:
+            limits = httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30,
+            )
+
+        self.limits = limits
+        self.http2 = http2
+        self.timeout = timeout
+        self.max_connections_per_host = max_connections_per_host
+        self._client_kwargs = client_kwargs
+
+        self._client: httpx.AsyncClient | None = None
+        self._host_semas: dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # created lazily, so that the pool binds to the running loop
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=self.limits,
+                http2=self.http2,
+                timeout=self.timeout,
+                **self._client_kwargs,
+            )
+
+        return self._client
+
     async def get(self, url, params=None, headers=None, exclude_none: bool = False):
-        async with httpx.AsyncClient(headers=headers) as client:
-            if exclude_none:
-                params = {k: v for k, v in params.items() if v is not None}
+        if exclude_none:
+            params = {k: v for k, v in params.items() if v is not None}
 
-            return await client.get(url, params=params)
+        async with self._host_limit(url):
+            return await self.client.get(url, params=params, headers=headers)
 
     async def post(
         self, url, params=None, data=None, headers=None, exclude_none: bool = False
     ):
-        async with httpx.AsyncClient(headers=headers) as client:
-            if exclude_none:
-                params = {k: v for k, v in params.items() if v is not None}
-                data = {k: v for k, v in data.items() if v is not None}
+        if exclude_none:
+            params = {k: v for k, v in params.items() if v is not None}
+            data = {k: v for k, v in data.items() if v is not None}
+
+        async with self._host_limit(url):
+            return await self.client.post(
+                url, params=params, data=data, headers=headers
+            )
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
-            return await client.get(url, params=params, data=data)
+    def _host_limit(self, url):
+        if self.max_connections_per_host is None:
+            return contextlib.nullcontext()
+
+        host = httpx.URL(url).host
+        sema = self._host_semas.get(host, None)
+        if sema is None:
+            sema = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semas[host] = sema
+
+        return sema
 
 
 class OpenSeaAPI(OpenSeaBase):
@@ -66,6 +140,10 @@ class OpenSeaAPI(OpenSeaBase):
         test: bool,
         log_level: str,
         rate_limiter: RateLimiter = FakeRateLimiter(),
+        client: Client | None = None,
+        retry: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = True,
     ):
         super().__init__(api_key, test, log_level)
 
@@ -74,28 +152,27 @@ class OpenSeaAPI(OpenSeaBase):
         self.v1_url = self.base_url / "api/v1"
         self.v2_url = self.base_url / "api/v2"
 
-        self.client = Client()
+        self.client = Client() if client is None else client
         self._rate_limiter = rate_limiter
+        self._retry = retry
+        self.cache = cache
+        self.single_flight = SingleFlight() if coalesce else None
+
+        self.typed = TypedOpenSeaAPI(self)
 
     ################################################################################
     # API
     async def contract(self, *, contract_address: str, chain: Chain) -> httpx.Response:
         url = str(self.v2_url / "chain" / chain / "contract" / contract_address)
-        coro = self.client.get(url, headers=self._headers)
-
-        return await self._rate_limiter.limit(coro)
+        return await self._get(url, key="contract")
 
     async def collection(self, slug: str) -> httpx.Response:
         url = str(self.v2_url / "collections" / slug)
-        coro = self.client.get(url, headers=self._headers)
-
-        return await self._rate_limiter.limit(coro)
+        return await self._get(url, key="collection")
 
     async def collection_stats(self, slug: str) -> httpx.Response:
         url = str(self.v2_url / "collections" / slug / "stats")
-        coro = self.client.get(url, headers=self._headers)
-
-        return await self._rate_limiter.limit(coro)
+        return await self._get(url, key="collection_stats")
 
     async def nft(
         self, *, contract_address: str, chain: Chain, token_id: str
@@ -109,8 +186,77 @@ class OpenSeaAPI(OpenSeaBase):
             / "nfts"
             / token_id
         )
-        coro = self.client.get(url, headers=self._headers)
-        return await self._rate_limiter.limit(coro)
+        return await self._get(url, key="nft")
+
+    async def nfts(
+        self,
+        identifiers: Iterable[tuple[Chain, str, str]],
+        concurrency: int = 10,
+        ordered: bool = False,
+    ):
+        """Yields a NFTResult for every (chain, contract_address, token_id)."""
+        assert concurrency >= 1, "concurrency must be at least 1"
+
+        identifiers = enumerate(identifiers)
+        results = asyncio.Queue(maxsize=2 * concurrency)
+        # in order, workers may only run this far ahead of the next result to
+        # yield, so a slow request doesn't buffer everything after it
+        ahead = asyncio.Semaphore(4 * concurrency) if ordered else None
+
+        async def fetch(identifier):
+            res = None
+            try:
+                chain, contract_address, token_id = identifier
+                res = await self.nft(
+                    contract_address=contract_address, chain=chain, token_id=token_id
+                )
+                res.raise_for_status()
+            except Exception as e:
+                return NFTResult(identifier, res, e)
+
+            return NFTResult(identifier, res, None)
+
+        async def worker():
+            # the iterator is shared, so identifiers are consumed lazily
+            while True:
+                if ahead is not None:
+                    await ahead.acquire()
+
+                item = next(identifiers, None)
+                if item is None:
+                    if ahead is not None:
+                        ahead.release()
+                    return
+
+                i, identifier = item
+                await results.put((i, await fetch(identifier)))
+
+        async def run():
+            try:
+                await asyncio.gather(*(worker() for _ in range(concurrency)))
+            finally:
+                await results.put(None)
+
+        task = asyncio.create_task(run())
+        try:
+            pending = {}
+            next_ = 0
+            while (item := await results.get()) is not None:
+                i, result = item
+                if not ordered:
+                    yield result
+                    continue
+
+                pending[i] = result
+                while next_ in pending:
+                    ahead.release()
+                    yield pending.pop(next_)
+                    next_ += 1
+
+            # surface errors that are not per item, e.g. from the iterable
+            await task
+        finally:
+            task.cancel()
 
     async def nfts_by_collection(
         self, slug: str, limit: int = 50, cursor: str = ""
@@ -123,10 +269,9 @@ class OpenSeaAPI(OpenSeaBase):
             "limit": limit,
             "next": cursor,
         }
-        coro = self.client.get(
-            url, params=params, headers=self._headers, exclude_none=True
+        return await self._get(
+            url, params=params, exclude_none=True, key="nfts_by_collection"
         )
-        return await self._rate_limiter.limit(coro)
 
     async def nfts_by_account(
         self, chain: Chain, account: str, limit: int = 200, cursor: str = ""
@@ -139,10 +284,9 @@ class OpenSeaAPI(OpenSeaBase):
             "limit": limit,
             "next": cursor,
         }
-        coro = self.client.get(
-            url, params=params, headers=self._headers, exclude_none=True
+        return await self._get(
+            url, params=params, exclude_none=True, key="nfts_by_account"
         )
-        return await self._rate_limiter.limit(coro)
 
     async def nft_events(
         self,
@@ -177,10 +321,33 @@ class OpenSeaAPI(OpenSeaBase):
             "next": cursor,
         }
 
-        coro = self.client.get(
-            url, params=params, headers=self._headers, exclude_none=True
+        return await self._get(url, params=params, exclude_none=True, key="nft_events")
+
+    async def collection_events(
+        self,
+        slug: str,
+        *,
+        after: int | None = None,
+        before: int | None = None,
+        event_type: list[EventType] | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> httpx.Response:
+        assert 1 <= limit <= 50, "limit exceeded"
+
+        url = str(self.v2_url / "events" / "collection" / slug)
+
+        params = {
+            "after": after,
+            "before": before,
+            "event_type": event_type,
+            "limit": limit,
+            "next": cursor,
+        }
+
+        return await self._get(
+            url, params=params, exclude_none=True, key="collection_events"
         )
-        return await self._rate_limiter.limit(coro)
 
     ################################################################################
     # V1
@@ -212,17 +379,65 @@ class OpenSeaAPI(OpenSeaBase):
             "cursor": cursor,
             "include_orders": include_orders,
         }
-        params = {k: v for k, v in params.items() if v is not None}
-        coro = self.client.get(
-            url,
-            params=params,
-            headers=self._headers,
-        )
-
-        return await self._rate_limiter.limit(coro)
+        return await self._get(url, params=params, exclude_none=True, key="assets")
 
     ################################################################################
     # UTILS
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def _get(self, url, params=None, exclude_none: bool = False, key=None):
+        if exclude_none:
+            params = {k: v for k, v in params.items() if v is not None}
+
+        cache_key = ResponseCache.key(url, params)
+        if self.cache is not None and self.cache.cacheable(key):
+            res = self.cache.get(cache_key)
+            if res is not None:
+                return res
+
+        if self.single_flight is None:
+            return await self._fetch(url, params, key, cache_key)
+
+        return await self.single_flight.do(
+            cache_key, lambda: self._fetch(url, params, key, cache_key)
+        )
+
+    async def _fetch(self, url, params, key, cache_key):
+        res = await self._request(url, params, key)
+        if self.cache is not None and self.cache.cacheable(key):
+            self.cache.set(cache_key, key, res)
+
+        return res
+
+    async def _request(self, url, params, key):
+        attempt = 0
+        while True:
+            coro = self.client.get(url, params=params, headers=self._headers)
+
+            try:
+                res = await self._rate_limiter.limit_key(coro, key=key)
+            except Exception as e:
+                if (
+                    self._retry is None
+                    or attempt >= self._retry.max_retries
+                    or not isinstance(e, self._retry.exceptions)
+                ):
+                    raise
+
+                retry_in = self._retry.delay(attempt)
+                logger.debug(f"Failed request, retry in: {retry_in}")
+            else:
+                self._rate_limiter.feedback(res, key=key)
+                if self._retry is None or not self._retry.should_retry(res, attempt):
+                    return res
+
+                retry_in = self._retry.delay(attempt, res)
+                logger.debug(f"{res.status_code} on {url}, retry in: {retry_in}")
+
+            attempt += 1
+            await asyncio.sleep(retry_in)
+
     @property
     def _headers(self):
         headers = None
@@ -230,3 +445,38 @@ class OpenSeaAPI(OpenSeaBase):
             headers = {"X-API-KEY": self.api_key}
 
         return headers
+
+
+class TypedOpenSeaAPI:
+    # validates the raw body straight into the v2 models, in a single pass
+    def __init__(self, api: OpenSeaAPI):
+        self.api = api
+
+    @staticmethod
+    def parse(res: httpx.Response, Model):
+        res.raise_for_status()
+        return Model.model_validate_json(res.content)
+
+    async def contract(self, **kwargs) -> v2.Contract:
+        return self.parse(await self.api.contract(**kwargs), v2.Contract)
+
+    async def collection(self, slug: str) -> v2.Collection:
+        return self.parse(await self.api.collection(slug), v2.Collection)
+
+    async def collection_stats(self, slug: str) -> v2.CollectionStats:
+        return self.parse(await self.api.collection_stats(slug), v2.CollectionStats)
+
+    async def nft(self, **kwargs) -> v2.NFTResponse:
+        return self.parse(await self.api.nft(**kwargs), v2.NFTResponse)
+
+    async def nfts_by_collection(self, *args, **kwargs) -> v2.NFTs:
+        return self.parse(await self.api.nfts_by_collection(*args, **kwargs), v2.NFTs)
+
+    async def nfts_by_account(self, *args, **kwargs) -> v2.NFTs:
+        return self.parse(await self.api.nfts_by_account(*args, **kwargs), v2.NFTs)
+
+    async def nft_events(self, **kwargs) -> v2.Events:
+        return self.parse(await self.api.nft_events(**kwargs), v2.Events)
+
+    async def collection_events(self, *args, **kwargs) -> v2.Events:
+        return self.parse(await self.api.collection_events(*args, **kwargs), v2.Events)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+from .helper import paginate
+
+
+def split(after: int, before: int, windows: int) -> list[tuple[int, int]]:
+    assert after < before, "after must be before before"
+
+    step = max(1, -(-(before - after) // windows))
+    return [(start, min(start + step, before)) for start in range(after, before, step)]
+
+
+def event_key(event: dict) -> tuple:
+    nft = event.get("nft") or event.get("asset") or {}
+    return (
+        event.get("event_type"),
+        event.get("event_timestamp"),
+        event.get("transaction"),
+        event.get("order_hash"),
+        nft.get("contract"),
+        nft.get("identifier"),
+        event.get("maker") or event.get("from_address") or event.get("seller"),
+    )
+
+
+async def _window(f, args, kwargs, after, before, events_key):
+    events = []
+    async for page in paginate(
+        f, *args, after=after, before=before, parse=True, **kwargs
+    ):
+        events += page.get(events_key, [])
+
+    events.sort(key=lambda e: e.get("event_timestamp", 0))
+    return events
+
+
+async def backfill(
+    f,
+    *args,
+    after: int,
+    before: int,
+    windows: int = 16,
+    concurrency: int = 4,
+    events_key: str = "asset_events",
+    **kwargs,
+):
+    """Yields the events of a time range in ascending timestamp order.
+
+    The range is split into windows that are paged through concurrently, e.g.
+    `backfill(api.nft_events, after=..., before=..., contract_address=...)`.
+
+    A non-2xx response raises `httpx.HTTPStatusError` instead of leaving a
+    hole in the history, give the api a `RetryPolicy` (`OpenSea(retry=...)`)
+    so throttled pages are retried first.
+    """
+    assert concurrency >= 1, "concurrency must be at least 1"
+
+    pending = list(reversed(split(after, before, windows)))
+    tasks = []
+
+    def schedule():
+        while pending and len(tasks) < concurrency:
+            after_, before_ = pending.pop()
+            coro = _window(f, args, kwargs, after_, before_, events_key)
+            tasks.append(asyncio.create_task(coro))
+
+    # windows only overlap at their boundaries, so the keys of the previous
+    # window are enough to drop duplicates
+    seen = set()
+    try:
+        schedule()
+        while tasks:
+            events = await tasks.pop(0)
+            schedule()
+
+            keys = set()
+            for event in events:
+                key = event_key(event)
+                if key in seen or key in keys:
+                    continue
+
+                keys.add(key)
+                yield event
+
+            seen = keys
+    finally:
+        for task in tasks:
+            task.cancel()
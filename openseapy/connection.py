@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import time
+from asyncio.exceptions import TimeoutError
+from collections import Counter
+
+import websockets
+from loguru import logger
+from websockets.exceptions import (
+    ConnectionClosed,
+    ConnectionClosedOK,
+    InvalidStatusCode,
+)
+
+from .models.stream import Message
+from .models.types import EventType
+from .utils import jsonlib
+
+
+class StreamConnection:
+    # a single websocket of an OpenSeaStream, reconnects on its own and feeds
+    # every frame into the stream's pipeline
+    def __init__(self, stream, index: int = 0, outbox_size: int = 10000):
+        self.stream = stream
+        self.index = index
+        self.ws = None
+        self.disconnected_at = None
+
+        # set while ws is connected and resubscribed
+        self.ready = asyncio.Event()
+        # frames waiting for the socket, (topic, frame)
+        self.outbox = asyncio.Queue(maxsize=outbox_size)
+        self._queued = Counter()
+
+        self._tasks = []
+
+    @property
+    def subscriptions(self):
+        return {
+            name
+            for name in self.stream.subscriptions
+            if self.stream.connection(name) is self
+        }
+
+    def start(self, loop=None):
+        if loop is None:
+            loop = asyncio
+
+        self._tasks = [
+            loop.create_task(self._recv_task()),
+            loop.create_task(self._keep_alive_task()),
+            loop.create_task(self._send_task()),
+        ]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        self.ready.clear()
+        if self.ws is not None:
+            await self.ws.close()
+            self.ws = None
+
+    async def _recv_task(self):
+        attempt = 0
+        while True:
+            try:
+                async with websockets.connect(self.stream.url) as ws:
+                    self.ws = ws
+                    attempt = 0
+
+                    # frames still in the outbox are flushed in order after
+                    # the resubscribe, so their topics are left to them
+                    for name in self.subscriptions:
+                        topic = f"collection:{name}"
+                        if not self._queued[topic]:
+                            await self.stream.subscriptions.rejoin(name, ws.send)
+
+                    self.ready.set()
+
+                    if self.disconnected_at is not None:
+                        self.stream._on_reconnect(
+                            self, self.disconnected_at, time.time()
+                        )
+                        self.disconnected_at = None
+
+                    while True:
+                        await self.stream._on_frame(await ws.recv())
+            except (
+                ConnectionClosedOK,
+                ConnectionClosed,
+                InvalidStatusCode,
+                TimeoutError,
+            ):
+                logger.error(
+                    f"Connection {self.index} closed, reconnection (recv task)"
+                )
+            except Exception as e:
+                logger.error("Uncaught exception (receive task), trace below:")
+                logger.exception(e)
+
+            # reset ws, remember when we lost it to fill the gap later on
+            self.ready.clear()
+            self.stream.subscriptions.interrupted(self.subscriptions)
+            if self.ws is not None and self.disconnected_at is None:
+                self.disconnected_at = time.time()
+            self.ws = None
+
+            retry_in = self.stream.reconnect.delay(attempt)
+            attempt += 1
+            logger.debug(f"Reconnecting {self.index} in: {retry_in}")
+            await asyncio.sleep(retry_in)
+
+    async def _keep_alive_task(self):
+        msg = Message(topic="phoenix", event=EventType.keep_alive, ref=0)
+        msg = jsonlib.dumps(msg.model_dump(mode="json"))
+
+        while True:
+            try:
+                await self.ready.wait()
+                await asyncio.sleep(self.stream._keep_alive_interval)
+                await self._send(msg, topic="phoenix")
+            except Exception as e:
+                logger.error("Uncaught exception (keep alive), trace below:")
+                logger.exception(e)
+                await asyncio.sleep(1)
+
+    async def _send_task(self):
+        while True:
+            topic, frame = await self.outbox.get()
+            while True:
+                await self.ready.wait()
+
+                ws = self.ws
+                try:
+                    await ws.send(frame)
+                    logger.debug(f"Sent ({self.index}): {frame}")
+                    break
+                except ConnectionClosed:
+                    # keep the frame until the receive task reconnected
+                    if self.ws is ws:
+                        self.ready.clear()
+                except Exception as e:
+                    logger.error("Uncaught exception (send task), trace below:")
+                    logger.exception(e)
+                    break
+
+            self._queued[topic] -= 1
+            if not self._queued[topic]:
+                del self._queued[topic]
+
+    async def _send(self, obj, topic: str | None = None):
+        self._queued[topic] += 1
+        await self.outbox.put((topic, obj))
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+from loguru import logger
+
+from .helper import paginate
+from .utils import jsonlib
+
+
+class Checkpoint:
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> dict | None:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(self, state: dict):
+        # write and rename, so a crash never leaves a half written checkpoint
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp, self.path)
+
+
+class CollectionCrawler:
+    def __init__(
+        self,
+        api,
+        slug: str,
+        sink: str,
+        checkpoint: str | None = None,
+        limit: int = 200,
+        prefetch: int = 1,
+    ):
+        self.api = api
+        self.slug = slug
+        self.sink = sink
+        self.checkpoint = Checkpoint(checkpoint or f"{sink}.checkpoint")
+        self.limit = limit
+        self.prefetch = prefetch
+
+    def _initial_state(self):
+        return {
+            "slug": self.slug,
+            "cursor": "",
+            "pages": 0,
+            "items": 0,
+            "offset": 0,
+            "done": False,
+        }
+
+    async def run(self) -> dict:
+        state = self.checkpoint.load()
+        if state is None:
+            state = self._initial_state()
+        elif state["slug"] != self.slug:
+            raise ValueError(
+                f"Checkpoint {self.checkpoint.path} belongs to: {state['slug']}"
+            )
+
+        if state["done"]:
+            return state
+
+        if state["pages"]:
+            logger.info(f"Resuming {self.slug} after {state['pages']} pages")
+
+        # drop whatever was written after the last checkpoint
+        with open(self.sink, "ab") as f:
+            f.truncate(state["offset"])
+
+        with open(self.sink, "ab") as f:
+            pages = paginate(
+                self.api.nfts_by_collection,
+                self.slug,
+                limit=self.limit,
+                cursor=state["cursor"],
+                prefetch=self.prefetch,
+                parse=True,
+            )
+            async for page in pages:
+                nfts = page.get("nfts", [])
+                for nft in nfts:
+                    f.write(jsonlib.dumps(nft).encode())
+                    f.write(b"\n")
+
+                f.flush()
+                os.fsync(f.fileno())
+
+                cursor = page.get("next", None)
+                state["cursor"] = cursor
+                state["pages"] += 1
+                state["items"] += len(nfts)
+                state["offset"] = f.tell()
+                state["done"] = cursor is None
+                self.checkpoint.save(state)
+
+                logger.debug(
+                    f"{self.slug}: {state['pages']} pages, {state['items']} nfts"
+                )
+
+        return state
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from loguru import logger
+
+from .dispatch import Batcher
+from .models.compact import CompactEvent
+from .models.stream import PAYLOAD_VALIDATORS
+from .models.types import EventType
+from .utils import jsonlib
+
+
+################################################################################
+# WORKER
+def decode_batch(frames, filters=()):
+    # runs in a worker process, returns (events, filtered, failed)
+    events = []
+    filtered = failed = 0
+
+    for frame in frames:
+        # a bad frame (or a failing filter) only costs that frame
+        try:
+            raw = jsonlib.loads(frame)
+            if not all(f(raw) for f in filters):
+                filtered += 1
+                continue
+
+            event = EventType(raw["event"])
+            validator = PAYLOAD_VALIDATORS.get(event, None)
+            if validator is None:
+                raw["event"] = event
+                events.append(raw)
+                continue
+
+            payload = raw["payload"]["payload"]
+            validator.validate_python(payload)
+            events.append(CompactEvent.from_payload(event, payload))
+        except Exception:
+            failed += 1
+
+    return events, filtered, failed
+
+
+################################################################################
+# POOL
+class DecodePool:
+    # decodes and validates raw frames in worker processes, only compact
+    # events (and small non-item frames) are sent back to the event loop
+    def __init__(
+        self,
+        processes: int | None = None,
+        batch_size: int = 256,
+        batch_latency: float = 0.01,
+        max_inflight: int = 4,
+    ):
+        self.processes = processes
+        self.max_inflight = max_inflight
+
+        self.frames = 0
+        self.events = 0
+        self.failed = 0
+        self.inflight = 0
+
+        self._batcher = Batcher(self._submit, batch_size, batch_latency)
+        self._inflight = None
+        self._executor = None
+        self._last = None
+        self._on_events = None
+        self._filters = ()
+
+    def start(self, on_events, filters=()):
+        # `filters` is read for every batch, so changes after start apply.
+        # they are sent to the workers and need to be picklable
+        self._on_events = on_events
+        self._filters = filters
+        self._inflight = asyncio.Semaphore(self.max_inflight)
+        self._executor = ProcessPoolExecutor(self.processes)
+
+    async def stop(self):
+        await self._batcher.flush()
+        if self._last is not None:
+            await asyncio.gather(self._last, return_exceptions=True)
+
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def put(self, frame):
+        self.frames += 1
+        await self._batcher.add(frame)
+
+    async def join(self):
+        await self._batcher.flush()
+        if self._last is not None:
+            await self._last
+
+    async def _submit(self, frames):
+        # blocks the reader once `max_inflight` batches are being decoded or
+        # waiting to be delivered
+        await self._inflight.acquire()
+        self.inflight += 1
+
+        loop = asyncio.get_running_loop()
+        filters = tuple(self._filters)
+        fut = loop.run_in_executor(self._executor, decode_batch, frames, filters)
+        self._last = asyncio.create_task(self._deliver(fut, self._last))
+
+    async def _deliver(self, fut, previous):
+        try:
+            events, filtered, failed = await fut
+        except Exception as e:
+            logger.error("Uncaught exception (decode pool), trace below:")
+            logger.exception(e)
+            events, filtered, failed = [], 0, 0
+
+        try:
+            # keep the order of the frames across batches
+            if previous is not None:
+                await asyncio.gather(previous, return_exceptions=True)
+
+            self.events += len(events)
+            self.failed += failed
+            await self._on_events(events, filtered)
+        finally:
+            # the slot is held until the batch is handed over, so a slow
+            # consumer blocks the reader
+            self.inflight -= 1
+            self._inflight.release()
+
+    def stats(self) -> dict:
+        return {
+            "frames": self.frames,
+            "events": self.events,
+            "failed": self.failed,
+            "pending": len(self._batcher),
+            "inflight": self.inflight,
+        }
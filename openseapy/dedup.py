@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+import time
+from collections import OrderedDict
+
+from .models.compact import CompactEvent
+
+
+def _address(user):
+    return (user or {}).get("address", None)
+
+
+def event_key(msg) -> tuple | None:
+    if isinstance(msg, CompactEvent):
+        return (msg.event, msg.nft_id, msg.timestamp, msg.maker, msg.taker)
+
+    payload = msg.get("payload", None)
+    payload = payload.get("payload", None) if isinstance(payload, dict) else None
+    if not isinstance(payload, dict):
+        return None
+
+    item = payload.get("item", None) or {}
+    transaction = payload.get("transaction", None) or {}
+    return (
+        msg.get("event", None),
+        item.get("nft_id", None),
+        payload.get("event_timestamp", None),
+        _address(payload.get("maker", None) or payload.get("from_account", None)),
+        transaction.get("hash", None) or payload.get("order_hash", None),
+    )
+
+
+class Deduplicator:
+    # remembers event keys for `window` seconds, but never more than
+    # `max_size` of them
+    def __init__(self, window: float = 600, max_size: int = 100_000, key=event_key):
+        self.window = window
+        self.max_size = max_size
+        self.key = key
+
+        self.seen = 0
+        self.suppressed = 0
+
+        self._keys: OrderedDict[tuple, float] = OrderedDict()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __call__(self, msg) -> bool:
+        key = self.key(msg)
+        if key is None:
+            return True
+
+        now = time.monotonic()
+        self._expire(now)
+
+        self.seen += 1
+        if key in self._keys:
+            self.suppressed += 1
+            return False
+
+        self._keys[key] = now
+        return True
+
+    def _expire(self, now):
+        keys = self._keys
+        while keys and (
+            len(keys) >= self.max_size or next(iter(keys.values())) < now - self.window
+        ):
+            keys.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._keys),
+            "seen": self.seen,
+            "suppressed": self.suppressed,
+        }
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from enum import Enum
+
+from loguru import logger
+
+from .models.compact import CompactEvent
+
+
+class Overflow(Enum):
+    # wait for space, which in turn stops reading from the socket
+    block = "block"
+    drop_oldest = "drop_oldest"
+    drop_newest = "drop_newest"
+
+
+class Dispatcher:
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        workers: int = 16,
+        overflow: Overflow | str = Overflow.block,
+    ):
+        assert maxsize >= 1, "maxsize must be at least 1"
+        assert workers >= 1, "workers must be at least 1"
+
+        self.maxsize = maxsize
+        self.workers = workers
+        self.overflow = Overflow(overflow)
+
+        self.processed = 0
+        self.dropped = 0
+
+        self._handler = None
+        self._queue = asyncio.Queue(maxsize)
+        self._tasks = []
+
+    @property
+    def depth(self):
+        return self._queue.qsize()
+
+    def start(self, handler):
+        self._handler = handler
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._worker(self._queue))
+                for _ in range(self.workers)
+            ]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def join(self):
+        await self._queue.join()
+
+    async def put(self, msg):
+        await self._put(self._queue, msg)
+
+    async def _put(self, queue, msg):
+        if self.overflow == Overflow.block:
+            await queue.put(msg)
+            return
+
+        if queue.full():
+            self.dropped += 1
+            if self.overflow == Overflow.drop_newest:
+                return
+
+            queue.get_nowait()
+            queue.task_done()
+
+        queue.put_nowait(msg)
+
+    async def _worker(self, queue):
+        while True:
+            msg = await queue.get()
+            try:
+                await self._handler(msg)
+            except Exception as e:
+                logger.error("Uncaught exception (dispatch), trace below:")
+                logger.exception(e)
+            finally:
+                self.processed += 1
+                queue.task_done()
+
+    def stats(self) -> dict:
+        return {
+            "depth": self.depth,
+            "maxsize": self.maxsize,
+            "processed": self.processed,
+            "dropped": self.dropped,
+        }
+
+
+def nft_id_key(msg):
+    if isinstance(msg, CompactEvent):
+        return msg.nft_id
+
+    payload = msg.get("payload", None) or {}
+    item = (payload.get("payload", None) or {}).get("item", None) or {}
+    return item.get("nft_id", None)
+
+
+def slug_key(msg):
+    if isinstance(msg, CompactEvent):
+        return msg.slug
+
+    payload = msg.get("payload", None) or {}
+    collection = (payload.get("payload", None) or {}).get("collection", None) or {}
+    return collection.get("slug", None)
+
+
+KEYS = {
+    "nft_id": nft_id_key,
+    "slug": slug_key,
+}
+
+
+class ShardedDispatcher(Dispatcher):
+    # messages with the same key always land on the same worker and are
+    # handled in order, different keys are still handled in parallel
+    def __init__(
+        self,
+        key="nft_id",
+        maxsize: int = 1000,
+        workers: int = 16,
+        overflow: Overflow | str = Overflow.block,
+    ):
+        super().__init__(maxsize, workers, overflow)
+
+        self.key = KEYS[key] if isinstance(key, str) else key
+        self._queues = [asyncio.Queue(maxsize) for _ in range(workers)]
+        self._next = 0
+
+    @property
+    def depth(self):
+        return sum(queue.qsize() for queue in self._queues)
+
+    def start(self, handler):
+        self._handler = handler
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._worker(queue)) for queue in self._queues
+            ]
+
+    async def join(self):
+        await asyncio.gather(*(queue.join() for queue in self._queues))
+
+    def shard(self, msg) -> int:
+        key = self.key(msg)
+        if key is None:
+            # unordered messages, e.g. replies, are spread round robin
+            self._next = (self._next + 1) % self.workers
+            return self._next
+
+        return hash(key) % self.workers
+
+    async def put(self, msg):
+        await self._put(self._queues[self.shard(msg)], msg)
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["shards"] = [queue.qsize() for queue in self._queues]
+
+        return stats
+
+
+class Batcher:
+    # collects messages for a batch handler, flushes once `size` messages are
+    # collected or the oldest one waited for `latency` seconds
+    def __init__(self, handler, size: int = 100, latency: float = 1.0):
+        assert size >= 1, "size must be at least 1"
+
+        self.handler = handler
+        self.size = size
+        self.latency = latency
+
+        self.batches = 0
+
+        self._batch = []
+        self._timer = None
+        self._flush_task = None
+        # batches are handed to the handler one at a time and in order
+        self._lock = asyncio.Lock()
+
+    def __len__(self):
+        return len(self._batch)
+
+    async def add(self, msg):
+        # a pending timed flush blocks like a full batch would, so a slow
+        # handler pushes back on the producer either way
+        if self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+
+        self._batch.append(msg)
+
+        if len(self._batch) >= self.size:
+            await self.flush()
+        else:
+            self._arm()
+
+    def _arm(self):
+        # a single timed flush at a time, the next one is armed once it's done
+        if self._timer is None and self._flush_task is None and self._batch:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.latency, self._flush_later)
+
+    def _flush_later(self):
+        self._timer = None
+        self._flush_task = asyncio.create_task(self._timed_flush())
+
+    async def _timed_flush(self):
+        try:
+            await self.flush()
+        finally:
+            self._flush_task = None
+            self._arm()
+
+    async def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+
+        async with self._lock:
+            self.batches += 1
+            try:
+                await self.handler(batch)
+            except Exception as e:
+                logger.error("Uncaught exception (batch handler), trace below:")
+                logger.exception(e)
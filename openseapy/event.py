@@ -1,7 +1,14 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import time
+
 from loguru import logger
 
-from .models.stream import Message
+from .dedup import Deduplicator
+from .dispatch import Batcher, Dispatcher
+from .models import v2
+from .models.compact import CompactEvent
+from .models.stream import LazyMessage, Message
 from .models.types import EventType
 
 
@@ -22,35 +29,123 @@ class OpenSeaEvent:
         EventType.item_received_bid: "on_item_received_bid",
     }
 
-    def __init__(self):
+    EVENT_BATCH_HANDLER_MAPPING = {
+        # collection
+        EventType.collection_offer: "on_collection_offer_batch",
+        EventType.trait_offer: "on_trait_offer_batch",
+        # item events
+        EventType.item_listed: "on_item_listed_batch",
+        EventType.item_sold: "on_item_sold_batch",
+        EventType.item_transferred: "on_item_transferred_batch",
+        EventType.item_metadata_updated: "on_item_metadata_updated_batch",
+        EventType.item_cancelled: "on_item_cancelled_batch",
+        EventType.item_received_offer: "on_item_received_offer_batch",
+        EventType.item_received_bid: "on_item_received_bid_batch",
+    }
+
+    # events fetched from the rest api to fill a gap in the stream
+    GAP_HANDLER = "on_gap_event"
+
+    def __init__(
+        self,
+        lazy: bool = False,
+        dispatcher: Dispatcher | None = None,
+        batch_size: int = 100,
+        batch_latency: float = 1.0,
+        dedup: Deduplicator | None = None,
+    ):
         self.event_handlers = {}
+        self.lazy = lazy
+        self.dispatcher = dispatcher
+        self.dedup = dedup
+
+        self.batch_size = batch_size
+        self.batch_latency = batch_latency
+        self.batchers = {}
+
+        self.decoded = 0
+        self.decode_time = 0.0
 
     def event(self, f):
         fname = f.__name__
-        allowed_function_names = self.EVENT_HANDLER_MAPPING.values()
+        allowed_function_names = [
+            *self.EVENT_HANDLER_MAPPING.values(),
+            *self.EVENT_BATCH_HANDLER_MAPPING.values(),
+            self.GAP_HANDLER,
+        ]
         if fname not in allowed_function_names:
             raise ValueError(
                 f"Unknown event_handler function: {fname}\n"
                 f"Allowed: {', '.join(v for v in allowed_function_names)}"
             )
 
+        if fname in self.EVENT_BATCH_HANDLER_MAPPING.values():
+            self.batchers[fname] = Batcher(f, self.batch_size, self.batch_latency)
+
         self.event_handlers[f.__name__] = f
 
         return f
 
+    async def flush(self):
+        await asyncio.gather(*(batcher.flush() for batcher in self.batchers.values()))
+
+    async def _dispatch(self, msg):
+        if self.dedup is not None and not self.dedup(msg):
+            return
+
+        if self.dispatcher is None:
+            asyncio.create_task(self._distribute(msg))
+        else:
+            await self.dispatcher.put(msg)
+
     async def _distribute(self, msg):
-        event = EventType(msg["event"])
+        # events from the decode pool are already decoded
+        decoded = isinstance(msg, CompactEvent)
+
+        event = msg.event if decoded else EventType(msg["event"])
         handler_name = self.EVENT_HANDLER_MAPPING.get(event, None)
         if handler_name is None:
             logger.error(f"unknown handler: {handler_name}")
             return
 
         handler = self.event_handlers.get(handler_name, None)
-        if handler is None:
+        batcher = self.batchers.get(
+            self.EVENT_BATCH_HANDLER_MAPPING.get(event, None), None
+        )
+        if handler is None and batcher is None:
             return
 
         try:
-            await handler(Message(**msg))
+            if decoded:
+                msg_ = msg
+            else:
+                start = time.perf_counter()
+                msg_ = LazyMessage(msg) if self.lazy else Message.decode(msg)
+                self.decode_time += time.perf_counter() - start
+                self.decoded += 1
         except Exception as e:
             logger.exception(e)
             logger.error(msg)
+            return
+
+        # a failing handler doesn't keep the message from the batch handler
+        if handler is not None:
+            try:
+                await handler(msg_)
+            except Exception as e:
+                logger.exception(e)
+                logger.error(msg)
+
+        if batcher is not None:
+            await batcher.add(msg_)
+
+    async def _distribute_gap(self, event):
+        handler = self.event_handlers.get(self.GAP_HANDLER, None)
+        if handler is None:
+            return
+
+        try:
+            await handler(v2.Event.model_validate(event))
+        except Exception as e:
+            logger.exception(e)
+            logger.error(event)
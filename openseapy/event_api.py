@@ -1,35 +1,26 @@
 # -*- coding: utf-8 -*-
-from functools import wraps
+from .subscriptions import Subscription, SubscriptionManager
 
-from .models.stream import Message
-from .models.types import EventType
 
+class OpenSeaEventAPI:
+    def __init__(self, join_timeout: float = 10.0):
+        self.subscriptions = SubscriptionManager(self, join_timeout)
 
-def send(f):
-    @wraps(f)
-    async def wrapper(self, *args, **kwargs):
-        obj = f(self, *args, **kwargs)
-        return await self._send(obj.json())
+    async def collection(self, name, sub=True) -> Subscription | None:
+        if sub:
+            return await self.subscriptions.join(name)
 
-    return wrapper
+        await self.subscriptions.leave(name)
 
+    async def subscribe(self, names, wait=True, timeout: float | None = None):
+        # joins are sent back to back, the replies are awaited together
+        names = list(names)
+        for name in names:
+            await self.subscriptions.join(name)
 
-class OpenSeaEventAPI:
-    subscriptions = set()
-
-    @send
-    def collection(self, name, sub=True, ref=0):
-        if sub:
-            self.subscriptions.add(name)
-        else:
-            try:
-                self.subscriptions.remove(name)
-            except KeyError:
-                pass
+        if wait:
+            return await self.subscriptions.wait(names, timeout)
 
-        req = Message(
-            topic=f"collection:{name}",
-            event=EventType.subscribe if sub else EventType.unsubscribe,
-            ref=ref,
-        )
-        return req
+    async def unsubscribe(self, names):
+        for name in names:
+            await self.subscriptions.leave(name)
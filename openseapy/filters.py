@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+import time
+
+from .models.compact import PRICE_KEYS
+from .models.types import EventType
+
+
+def _payload(raw):
+    payload = raw.get("payload", None)
+    if not isinstance(payload, dict):
+        return None
+
+    return payload.get("payload", None)
+
+
+class EventFilter:
+    # works on the decoded json frame, before any model is built, frames that
+    # are not item or collection events (replies, ...) always pass
+    def __init__(
+        self,
+        slugs=None,
+        exclude_slugs=None,
+        event_types=None,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        chains=None,
+    ):
+        self.slugs = None if slugs is None else set(slugs)
+        self.exclude_slugs = set(exclude_slugs or ())
+        self.event_types = (
+            None
+            if event_types is None
+            else {EventType(event).value for event in event_types}
+        )
+        self.min_price = min_price
+        self.max_price = max_price
+        self.chains = None if chains is None else set(chains)
+
+    def __call__(self, raw: dict) -> bool:
+        payload = _payload(raw)
+        if not isinstance(payload, dict):
+            return True
+
+        event = raw.get("event", None)
+        if isinstance(event, EventType):
+            event = event.value
+        if self.event_types is not None and event not in self.event_types:
+            return False
+
+        slug = (payload.get("collection", None) or {}).get("slug", None)
+        if slug in self.exclude_slugs:
+            return False
+        if self.slugs is not None and slug not in self.slugs:
+            return False
+
+        if self.chains is not None:
+            nft_id = (payload.get("item", None) or {}).get("nft_id", None) or ""
+            if nft_id.split("/", 1)[0] not in self.chains:
+                return False
+
+        if self.min_price is not None or self.max_price is not None:
+            return self._price_ok(payload)
+
+        return True
+
+    def _price_ok(self, payload):
+        # events without a price, e.g. transfers, are not price filtered
+        price = None
+        for key in PRICE_KEYS:
+            if payload.get(key, None) is not None:
+                price = int(payload[key])
+                break
+
+        if price is None:
+            return True
+
+        decimals = (payload.get("payment_token", None) or {}).get("decimals", 18)
+        price /= 10**decimals
+        if self.min_price is not None and price < self.min_price:
+            return False
+        if self.max_price is not None and price > self.max_price:
+            return False
+
+        return True
+
+
+class FilterRegistry:
+    def __init__(self):
+        self.filters = []
+
+        self.seen = 0
+        self.filtered = 0
+        self.filter_time = 0.0
+
+    def __len__(self):
+        return len(self.filters)
+
+    def add(self, f):
+        self.filters.append(f)
+        return f
+
+    def remove(self, f):
+        self.filters.remove(f)
+
+    def __call__(self, raw: dict) -> bool:
+        if not self.filters:
+            return True
+
+        start = time.perf_counter()
+        accepted = all(f(raw) for f in self.filters)
+        self.filter_time += time.perf_counter() - start
+
+        self.seen += 1
+        if not accepted:
+            self.filtered += 1
+
+        return accepted
+
+    def stats(self, decode_time: float = 0.0) -> dict:
+        # `decode_time` is the average time it takes to decode one message,
+        # every filtered message saves that, minus the time spent filtering
+        return {
+            "seen": self.seen,
+            "filtered": self.filtered,
+            "filter_time": self.filter_time,
+            "saved_time": self.filtered * decode_time - self.filter_time,
+        }
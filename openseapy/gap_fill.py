@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+import datetime as dt
+
+from loguru import logger
+
+from .backfill import backfill
+from .dedup import Deduplicator
+from .models.compact import CompactEvent
+from .models.types import EventType
+
+# stream events and rest events, mapped to a common kind
+STREAM_KINDS = {
+    EventType.item_sold: "sale",
+    EventType.item_transferred: "transfer",
+    EventType.item_listed: "listing",
+    EventType.item_cancelled: "cancel",
+    EventType.item_received_offer: "item_offer",
+    EventType.item_received_bid: "item_offer",
+}
+
+
+def _rest_key(event):
+    kind = event.get("event_type", None)
+    if kind == "order":
+        kind = event.get("order_type", None)
+
+    nft = event.get("nft", None) or event.get("asset", None) or {}
+    return (
+        kind,
+        event.get("chain", None),
+        nft.get("contract", None),
+        nft.get("identifier", None),
+        event.get("event_timestamp", None),
+    )
+
+
+def _stream_key(msg):
+    event = msg.get("event", None)
+    payload = msg.get("payload", None)
+    payload = payload.get("payload", None) if isinstance(payload, dict) else None
+    if not isinstance(payload, dict):
+        return None
+
+    nft_id = (payload.get("item", None) or {}).get("nft_id", None)
+    if not isinstance(nft_id, str) or nft_id.count("/") < 2:
+        return None
+
+    timestamp = payload.get("event_timestamp", None)
+    if timestamp is not None:
+        timestamp = dt.datetime.fromisoformat(timestamp).timestamp()
+
+    chain, contract, token_id = nft_id.rsplit("/", 2)
+    kind = STREAM_KINDS.get(EventType(event), None) if event else None
+    return (kind, chain, contract, token_id, timestamp)
+
+
+def gap_key(msg) -> tuple | None:
+    # the same event, whether it came from the stream or the rest api, None
+    # if the event can't be keyed
+    try:
+        return _gap_key(msg)
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _gap_key(msg):
+    if isinstance(msg, CompactEvent):
+        key = (
+            STREAM_KINDS.get(msg.event, None),
+            msg.chain,
+            msg.contract,
+            msg.token_id,
+            msg.timestamp,
+        )
+    elif "topic" in msg:
+        key = _stream_key(msg)
+    else:
+        key = _rest_key(msg)
+
+    if key is None or key[0] is None or key[4] is None or key[2] is None:
+        return None
+
+    kind, chain, contract, token_id, timestamp = key
+    return (kind, chain, contract.lower(), str(token_id), int(timestamp))
+
+
+class GapFiller:
+    # fetches the events of an outage from the rest api, events that were
+    # also received live are skipped
+    def __init__(
+        self,
+        api,
+        event_types=None,
+        margin: float = 5.0,
+        windows: int = 1,
+        concurrency: int = 2,
+        window: float = 3600,
+    ):
+        self.api = api
+        self.event_types = event_types
+        self.margin = margin
+        self.windows = windows
+        self.concurrency = concurrency
+
+        self.gaps = 0
+        self.filled = 0
+        self.duplicates = 0
+        self.failed = 0
+
+        if getattr(api, "_retry", False) is None:
+            logger.warning("Gap fills without a RetryPolicy fail on the first 429")
+
+        self._seen = Deduplicator(window=window, key=gap_key)
+
+    def observe(self, msg):
+        # called from the receive loop, must never raise into it
+        try:
+            self._seen(msg)
+        except Exception as e:
+            logger.error("Failed to observe event, trace below:")
+            logger.exception(e)
+
+    async def fill(self, stream, slugs, after: float, before: float):
+        self.gaps += 1
+        after, before = int(after - self.margin), int(before + self.margin) + 1
+
+        for slug in slugs:
+            if slug == "*":
+                logger.warning("Can't fill gaps of a '*' subscription, skipping")
+                continue
+
+            logger.info(f"Filling gap of {slug}: {after} - {before}")
+            try:
+                events = backfill(
+                    self.api.collection_events,
+                    slug,
+                    after=after,
+                    before=before,
+                    windows=self.windows,
+                    concurrency=self.concurrency,
+                    event_type=self.event_types,
+                )
+                async for event in events:
+                    if not self._seen(event):
+                        self.duplicates += 1
+                        continue
+
+                    self.filled += 1
+                    await stream._distribute_gap(event)
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Failed to fill gap of {slug}, trace below:")
+                logger.exception(e)
+
+    def stats(self) -> dict:
+        return {
+            "gaps": self.gaps,
+            "filled": self.filled,
+            "duplicates": self.duplicates,
+            "failed": self.failed,
+        }
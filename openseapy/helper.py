@@ -1,25 +1,111 @@
 import asyncio
+import time
 from functools import wraps
 
 import httpx
 from loguru import logger
+from pydantic import BaseModel
 
 from .exceptions import RateLimitError
+from .utils import jsonlib
 
 
-async def paginate(f, *args, cursor_key="next", **kwargs):
+class PaginationStats:
+    def __init__(self):
+        self.pages = 0
+        # time the consumer was blocked on the next page vs. time spent in the
+        # consumer between two pages
+        self.network_wait = 0.0
+        self.consumer_time = 0.0
+
+    def __repr__(self):
+        return (
+            f"PaginationStats(pages={self.pages}, "
+            f"network_wait={self.network_wait:.3f}, "
+            f"consumer_time={self.consumer_time:.3f})"
+        )
+
+
+async def _pages(f, args, kwargs, cursor_key):
     cursor = kwargs.get("cursor", "")
     while cursor is not None:
         kwargs["cursor"] = cursor
         res = await f(*args, **kwargs)
-        j = res.json()
+        if isinstance(res, BaseModel):
+            # typed responses already carry their cursor
+            j = res
+            cursor = getattr(res, cursor_key, None)
+        else:
+            # an error body (e.g. a 429) would read as an empty last page
+            if not res.is_success:
+                res.raise_for_status()
+
+            j = jsonlib.loads(res.content)
+            cursor = j.get(cursor_key, None)
 
-        cursor = j.get(cursor_key, None)
-        yield res
+        yield res, j
 
-        if cursor is None:
+
+async def _prefetch(pages, depth):
+    queue = asyncio.Queue(maxsize=depth)
+
+    async def produce():
+        try:
+            async for page in pages:
+                await queue.put((page, None))
+        except Exception as e:
+            await queue.put((None, e))
             return
 
+        await queue.put((None, None))
+
+    task = asyncio.create_task(produce())
+    try:
+        while True:
+            page, e = await queue.get()
+            if e is not None:
+                raise e
+            if page is None:
+                return
+
+            yield page
+    finally:
+        task.cancel()
+
+
+async def paginate(
+    f,
+    *args,
+    cursor_key="next",
+    prefetch: int = 0,
+    parse: bool = False,
+    stats: PaginationStats | None = None,
+    **kwargs,
+):
+    pages = _pages(f, args, kwargs, cursor_key)
+    if prefetch > 0:
+        pages = _prefetch(pages, prefetch)
+
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                res, j = await pages.__anext__()
+            except StopAsyncIteration:
+                return
+            fetched = time.perf_counter()
+
+            # the body is already decoded, `parse` hands it out instead of the
+            # response so the consumer does not decode it a second time
+            yield j if parse else res
+
+            if stats is not None:
+                stats.pages += 1
+                stats.network_wait += fetched - start
+                stats.consumer_time += time.perf_counter() - fetched
+    finally:
+        await pages.aclose()
+
 
 async def linear_retry(self, make_coro):
     for i in range(1, 10000):
@@ -69,11 +155,10 @@ def get(response_model):
                 url, params = url_and_maybe_params, {}
 
             async with self._sema:
-                async with httpx.AsyncClient() as client:
-                    res = await linear_retry(
-                        self,
-                        lambda: client.get(url, params=params, headers=self._headers),
-                    )
+                res = await linear_retry(
+                    self,
+                    lambda: self.client.get(url, params=params, headers=self._headers),
+                )
 
             if res is None:
                 return res
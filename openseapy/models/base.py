@@ -1,4 +1,5 @@
 import datetime as dt
+from functools import cached_property
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
@@ -59,10 +60,10 @@ class Item(BaseModel):
     nft_id: str
     permalink: str
 
-    @property
+    @cached_property
     def token_id(self):
         return self.nft_id.rsplit("/", 1)[-1]
 
-    @property
+    @cached_property
     def token_address(self):
         return self.nft_id.rsplit("/", 2)[-2]
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+import datetime as dt
+
+from .types import EventType
+
+PRICE_KEYS = ("base_price", "sale_price")
+
+
+def _timestamp(value):
+    if value is None:
+        return None
+
+    return dt.datetime.fromisoformat(value).timestamp()
+
+
+def _address(user):
+    if not user:
+        return None
+
+    return user.get("address", None)
+
+
+class CompactEvent:
+    # flat, slotted record of a stream event, prices are integer wei
+    __slots__ = (
+        "event",
+        "slug",
+        "chain",
+        "contract",
+        "token_id",
+        "price",
+        "decimals",
+        "symbol",
+        "quantity",
+        "maker",
+        "taker",
+        "timestamp",
+    )
+
+    def __init__(
+        self,
+        event: EventType,
+        slug: str,
+        chain: str | None = None,
+        contract: str | None = None,
+        token_id: int | str | None = None,
+        price: int | None = None,
+        decimals: int | None = None,
+        symbol: str | None = None,
+        quantity: int | None = None,
+        maker: str | None = None,
+        taker: str | None = None,
+        timestamp: float | None = None,
+    ):
+        self.event = event
+        self.slug = slug
+        self.chain = chain
+        self.contract = contract
+        self.token_id = token_id
+        self.price = price
+        self.decimals = decimals
+        self.symbol = symbol
+        self.quantity = quantity
+        self.maker = maker
+        self.taker = taker
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_frame(cls, raw: dict) -> "CompactEvent":
+        return cls.from_payload(EventType(raw["event"]), raw["payload"]["payload"])
+
+    @classmethod
+    def from_payload(cls, event: EventType, payload: dict) -> "CompactEvent":
+        chain = contract = token_id = None
+
+        item = payload.get("item", None) or {}
+        nft_id = item.get("nft_id", None)
+        if nft_id:
+            # <chain>/<contract>/<token_id>, parsed once. token ids that
+            # aren't numbers (e.g. solana mints) are kept as they are
+            parts = nft_id.rsplit("/", 2)
+            token_id = parts[-1]
+            if len(parts) == 3:
+                chain, contract = parts[0], parts[1]
+            else:
+                chain = (item.get("chain", None) or {}).get("name", None)
+            if token_id.isdigit():
+                token_id = int(token_id)
+
+        price = None
+        for key in PRICE_KEYS:
+            if payload.get(key, None) is not None:
+                price = int(payload[key])
+                break
+
+        token = payload.get("payment_token", None) or {}
+
+        maker = _address(payload.get("maker", None))
+        taker = _address(payload.get("taker", None))
+        if event == EventType.item_transferred:
+            maker = _address(payload.get("from_account", None))
+            taker = _address(payload.get("to_account", None))
+
+        return cls(
+            event=event,
+            slug=payload["collection"]["slug"],
+            chain=chain,
+            contract=contract,
+            token_id=token_id,
+            price=price,
+            decimals=token.get("decimals", None),
+            symbol=token.get("symbol", None),
+            quantity=payload.get("quantity", None),
+            maker=maker,
+            taker=taker,
+            timestamp=_timestamp(payload.get("event_timestamp", None)),
+        )
+
+    @property
+    def nft_id(self):
+        if self.contract is None:
+            return None
+
+        return f"{self.chain}/{self.contract}/{self.token_id}"
+
+    @property
+    def value(self) -> float | None:
+        # price in units of the payment token, e.g. ETH
+        if self.price is None or self.decimals is None:
+            return None
+
+        return self.price / 10**self.decimals
+
+    def __eq__(self, other):
+        if not isinstance(other, CompactEvent):
+            return NotImplemented
+
+        return all(getattr(self, k) == getattr(other, k) for k in self.__slots__)
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={getattr(self, k)!r}" for k in self.__slots__)
+        return f"CompactEvent({fields})"
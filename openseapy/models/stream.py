@@ -1,7 +1,8 @@
 import datetime as dt
+from functools import cached_property, lru_cache
 from typing import List, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import BaseModel, ConfigDict, TypeAdapter, model_validator
 
 from .types import EventType, ListingType
 
@@ -59,11 +60,11 @@ class Item(BaseModel):
     nft_id: Optional[str]
     permalink: Optional[str]
 
-    @property
+    @cached_property
     def token_id(self):
         return self.nft_id.rsplit("/", 1)[-1]
 
-    @property
+    @cached_property
     def token_address(self):
         return self.nft_id.rsplit("/", 2)[-2]
 
@@ -206,6 +207,12 @@ MESSAGE_MAPPING = {
 }
 
 
+# one prebuilt validator per event type, so every payload is validated once
+PAYLOAD_VALIDATORS = {
+    event: TypeAdapter(Cls).validator for event, Cls in MESSAGE_MAPPING.items()
+}
+
+
 class Message(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -214,14 +221,113 @@ class Message(BaseModel):
     payload: Union[dict, ItemEvent] = {}
     ref: Optional[int]
 
-    @model_validator(mode="after")
+    @model_validator(mode="before")
+    @classmethod
     def parse_payload(cls, values):
-        Cls = MESSAGE_MAPPING.get(values["event"], None)
-        if Cls is not None:
-            Message._parse_payload(values, Cls)
+        if isinstance(values, dict) and "event" in values:
+            values = dict(values)
+            values["payload"] = _parse_payload(
+                EventType(values["event"]), values.get("payload", {})
+            )
 
         return values
 
-    @staticmethod
-    def _parse_payload(values, Cls):
-        values["payload"] = Cls(**values["payload"]["payload"])
+    @classmethod
+    def decode(cls, raw: dict) -> "Message":
+        # the envelope is trusted, only the payload needs validation
+        event = EventType(raw["event"])
+        return cls.model_construct(
+            topic=raw["topic"],
+            event=event,
+            payload=_parse_payload(event, raw.get("payload", {})),
+            ref=raw.get("ref", None),
+        )
+
+
+def _parse_payload(event, payload):
+    validator = PAYLOAD_VALIDATORS.get(event, None)
+    if validator is None or not isinstance(payload, dict):
+        return payload
+
+    return validator.validate_python(payload["payload"])
+
+
+################################################################################
+# LAZY
+@lru_cache(maxsize=None)
+def _field_validators(Cls):
+    return {
+        name: (TypeAdapter(field.rebuild_annotation()).validator, field)
+        for name, field in Cls.model_fields.items()
+    }
+
+
+class LazyPayload:
+    # validates a field of the event model on first access only
+    __slots__ = ("_Cls", "_raw", "_cache", "_validators")
+
+    def __init__(self, Cls, raw: dict):
+        self._Cls = Cls
+        self._raw = raw
+        self._cache = {}
+        self._validators = _field_validators(Cls)
+
+    def __getattr__(self, name):
+        # fields never start with "_", and on a bare instance (copy, pickle)
+        # the slots below aren't set yet
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
+        try:
+            validator, field = self._validators[name]
+        except KeyError:
+            raise AttributeError(f"{self._Cls.__name__} has no field: {name}")
+
+        if name in self._raw:
+            value = validator.validate_python(self._raw[name])
+        elif not field.is_required():
+            value = field.get_default(call_default_factory=True)
+        else:
+            value = validator.validate_python(None)
+
+        self._cache[name] = value
+        return value
+
+    def validate(self):
+        return self._Cls.model_validate(self._raw)
+
+    def dict(self):
+        return self._raw
+
+
+class LazyMessage:
+    __slots__ = ("topic", "event", "ref", "_raw", "_payload")
+
+    def __init__(self, raw: dict):
+        event = raw["event"]
+
+        self.topic = raw["topic"]
+        self.event = event if isinstance(event, EventType) else EventType(event)
+        self.ref = raw.get("ref", None)
+        self._raw = raw
+        self._payload = None
+
+    @property
+    def payload(self):
+        if self._payload is None:
+            Cls = MESSAGE_MAPPING.get(self.event, None)
+            payload = self._raw.get("payload", {})
+            if Cls is None:
+                self._payload = payload
+            else:
+                self._payload = LazyPayload(Cls, payload["payload"])
+
+        return self._payload
+
+    def dict(self):
+        return self._raw
@@ -0,0 +1,174 @@
+import datetime as dt
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+################################################################################
+# BASE
+class ContractRef(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    address: str
+    chain: str
+
+
+class Fee(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    fee: float
+    recipient: str
+    required: bool = False
+
+
+class Trait(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    trait_type: str
+    display_type: Optional[str] = None
+    max_value: Optional[str | int | float] = None
+    value: Optional[str | int | float] = None
+
+
+class Owner(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    address: str
+    quantity: int
+
+
+class NFT(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    identifier: str
+    collection: str
+    contract: str
+    token_standard: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    image_url: Optional[str] = None
+    metadata_url: Optional[str] = None
+    opensea_url: Optional[str] = None
+    updated_at: Optional[str] = None
+    is_disabled: bool = False
+    is_nsfw: bool = False
+
+    # only returned for single nft lookups
+    animation_url: Optional[str] = None
+    is_suspicious: Optional[bool] = None
+    creator: Optional[str] = None
+    traits: Optional[List[Trait]] = None
+    owners: Optional[List[Owner]] = None
+
+
+class Contract(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    address: str
+    chain: str
+    collection: Optional[str] = None
+    contract_standard: str
+    name: Optional[str] = None
+    total_supply: Optional[int] = None
+
+
+class Collection(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    collection: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    image_url: Optional[str] = None
+    banner_image_url: Optional[str] = None
+    owner: Optional[str] = None
+    safelist_status: Optional[str] = None
+    category: Optional[str] = None
+    is_disabled: bool = False
+    is_nsfw: bool = False
+    trait_offers_enabled: bool = False
+    collection_offers_enabled: bool = False
+    opensea_url: Optional[str] = None
+    project_url: Optional[str] = None
+    wiki_url: Optional[str] = None
+    discord_url: Optional[str] = None
+    telegram_url: Optional[str] = None
+    twitter_username: Optional[str] = None
+    instagram_username: Optional[str] = None
+    contracts: List[ContractRef] = []
+    editors: List[str] = []
+    fees: List[Fee] = []
+    total_supply: Optional[int] = None
+    created_date: Optional[dt.date] = None
+
+    @property
+    def slug(self):
+        return self.collection
+
+
+class TotalStats(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    volume: float
+    sales: int
+    average_price: float
+    num_owners: int
+    market_cap: float
+    floor_price: float
+    floor_price_symbol: str
+
+
+class IntervalStats(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    interval: str
+    volume: float
+    volume_diff: float
+    volume_change: float
+    sales: int
+    sales_diff: int
+    average_price: float
+
+
+class Event(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="allow")
+
+    event_type: str
+    event_timestamp: int
+    chain: Optional[str] = None
+    transaction: Optional[str] = None
+    order_hash: Optional[str] = None
+    quantity: Optional[int] = None
+    nft: Optional[NFT] = None
+
+
+################################################################################
+# RESPONSES
+class PaginatedResponse(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    next: Optional[str] = None
+
+
+class CollectionStats(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    total: TotalStats
+    intervals: List[IntervalStats] = []
+
+
+class NFTResponse(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    nft: NFT
+
+
+class NFTs(PaginatedResponse):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    nfts: List[NFT]
+
+
+class Events(PaginatedResponse):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    asset_events: List[Event]
@@ -1,6 +1,8 @@
-from .api import OpenSeaAPI
+from .api import Client, OpenSeaAPI
 from .stream import OpenSeaStream
+from .utils.cache import ResponseCache
 from .utils.rate_limiter import FakeRateLimiter, RateLimiter
+from .utils.retry import RetryPolicy
 
 
 class OpenSea:
@@ -11,7 +13,25 @@ class OpenSea:
         stream: bool = False,
         log_level="ERROR",
         rate_limiter: RateLimiter = FakeRateLimiter(),
+        client: Client | None = None,
+        retry: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = True,
+        stream_options: dict | None = None,
     ):
-        self.api = OpenSeaAPI(api_key, test, log_level, rate_limiter)
+        self.api = OpenSeaAPI(
+            api_key, test, log_level, rate_limiter, client, retry, cache, coalesce
+        )
         if stream:
-            self.stream = OpenSeaStream(api_key, test, log_level)
+            self.stream = OpenSeaStream(
+                api_key, test, log_level, **(stream_options or {})
+            )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.api.aclose()
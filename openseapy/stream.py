@@ -1,41 +1,46 @@
 # -*- coding: utf-8 -*-
 import asyncio
-import json
-from asyncio.exceptions import TimeoutError
-from functools import wraps
+import zlib
+from collections import deque
 
-import websockets
 from loguru import logger
-from websockets.exceptions import (
-    ConnectionClosed,
-    ConnectionClosedOK,
-    InvalidStatusCode,
-)
 
 from . import utils
 from .base import OpenSeaBase
+from .connection import StreamConnection
+from .decode_pool import DecodePool
+from .dedup import Deduplicator
+from .dispatch import Dispatcher
 from .event import OpenSeaEvent
 from .event_api import OpenSeaEventAPI
-from .models.stream import Message
+from .filters import FilterRegistry
+from .gap_fill import GapFiller
 from .models.types import EventType
-
-
-def with_ws(f):
-    @wraps(f)
-    async def wrapper(self, *args, **kwargs):
-        while not hasattr(self, "ws") or getattr(self, "ws") is None:
-            await asyncio.sleep(0.2)
-
-        return await f(self, *args, **kwargs)
-
-    return wrapper
+from .utils import jsonlib
+from .utils.retry import RetryPolicy
 
 
 class OpenSeaStream(OpenSeaBase, OpenSeaEvent, OpenSeaEventAPI):
-    def __init__(self, api_key: str, test: bool, log_level: str):
+    def __init__(
+        self,
+        api_key: str,
+        test: bool,
+        log_level: str,
+        lazy: bool = False,
+        dispatcher: Dispatcher | None = None,
+        batch_size: int = 100,
+        batch_latency: float = 1.0,
+        connections: int = 1,
+        decode_pool: DecodePool | None = None,
+        dedup: Deduplicator | None = None,
+        reconnect: RetryPolicy | None = None,
+        gap_filler: GapFiller | None = None,
+        outbox_size: int = 10000,
+        join_timeout: float = 10.0,
+    ):
         OpenSeaBase.__init__(self, api_key, test, log_level)
-        OpenSeaEvent.__init__(self)
-        OpenSeaEventAPI.__init__(self)
+        OpenSeaEvent.__init__(self, lazy, dispatcher, batch_size, batch_latency, dedup)
+        OpenSeaEventAPI.__init__(self, join_timeout)
 
         testnet = "testnets-" if test else ""
         self.url = (
@@ -43,77 +48,120 @@ class OpenSeaStream(OpenSeaBase, OpenSeaEvent, OpenSeaEventAPI):
         )
         self._keep_alive_interval = 20
 
-        self._subscriptions = set
+        self.filters = FilterRegistry()
+        self.decode_pool = decode_pool
+        self.failed_frames = 0
+
+        self.reconnect = RetryPolicy() if reconnect is None else reconnect
+        self.gap_filler = gap_filler
+        # (connection, disconnected at, reconnected at)
+        self.outages = deque(maxlen=100)
+        self._gap_tasks = set()
+
+        assert connections >= 1, "connections must be at least 1"
+        self.connections = [
+            StreamConnection(self, i, outbox_size) for i in range(connections)
+        ]
+
+    @property
+    def ws(self):
+        return self.connections[0].ws
+
+    def connection(self, name) -> StreamConnection:
+        # stable across restarts, so a collection keeps its connection
+        i = zlib.crc32(name.encode()) % len(self.connections)
+        return self.connections[i]
 
     async def start(self, loop=None):
-        if loop is None:
-            loop = asyncio
-
-        loop.create_task(self._recv_task())
-        loop.create_task(self._keep_alive_task())
-
-    async def _recv_task(self):
-        while True:
-            try:
-                async with websockets.connect(self.url) as ws:
-                    self.ws = ws
-
-                    for name in self.subscriptions:
-                        await self.collection(name, sub=True)
-
-                    while True:
-                        res = await ws.recv()
-                        res = json.loads(res)
-                        res["event"] = EventType(res["event"])
-
-                        if self.log_level == "DEBUG":
-                            logger.debug(f"\n{utils.pformat(res)}")
-
-                        asyncio.create_task(self._distribute(res))
-            except (
-                ConnectionClosedOK,
-                ConnectionClosed,
-                InvalidStatusCode,
-                TimeoutError,
-            ):
-                logger.error("Connection closed, reconnection (recv task)")
-            except Exception as e:
-                logger.error("Uncaught exception (receive task), trace below:")
-                logger.exception(e)
-                asyncio.sleep(1)
-
-            # reset ws
-            self.ws = None
-
-    @with_ws
-    async def _keep_alive_task(self):
-        msg = Message(topic="phoenix", event=EventType.keep_alive, ref=0).json()
-
-        while True:
-            try:
-                await asyncio.sleep(self._keep_alive_interval)
-                if self.ws is None:
-                    logger.error("Waiting for ws to reconnect... (keep alive)")
-                    continue
-
-                await self.ws.send(msg)
-            except (
-                ConnectionClosed,
-                ConnectionClosedOK,
-                InvalidStatusCode,
-                TimeoutError,
-            ):
-                logger.error("Connection close, reconnection (keep alive)")
-            except Exception as e:
-                logger.error(f"Uncaught exception (keep alive), trace below:")
-                logger.exception(e)
-                asyncio.sleep(1)
-
-    @with_ws
-    async def _send(self, obj):
-        while self.ws is None:
-            logger.error("Waiting for ws to reconnect... (send)")
-            await asyncio.sleep(1)
-
-        logger.debug(f"Sending: {obj}")
-        await self.ws.send(obj)
+        if self.dispatcher is not None:
+            self.dispatcher.start(self._distribute)
+
+        if self.decode_pool is not None:
+            self.decode_pool.start(self._on_decoded, self.filters.filters)
+
+        for connection in self.connections:
+            connection.start(loop)
+
+    async def stop(self):
+        await asyncio.gather(*(c.stop() for c in self.connections))
+        await self.subscriptions.stop()
+
+        for task in self._gap_tasks:
+            task.cancel()
+
+        if self.decode_pool is not None:
+            await self.decode_pool.stop()
+
+        if self.dispatcher is not None:
+            await self.dispatcher.stop()
+
+        # hand out what's left in the batches, this also cancels their timers
+        await self.flush()
+
+    async def _on_frame(self, res):
+        if self.decode_pool is not None:
+            await self.decode_pool.put(res)
+            return
+
+        # undecodable frames and unknown events are skipped, like in the
+        # decode pool, they must not tear down the connection
+        try:
+            res = jsonlib.loads(res)
+            if not self.filters(res):
+                return
+
+            res["event"] = EventType(res["event"])
+        except Exception as e:
+            self.failed_frames += 1
+            logger.warning(f"Skipping frame ({e!r}): {str(res)[:200]}")
+            return
+
+        if res["event"] is EventType.reply:
+            self.subscriptions.on_reply(res)
+        if self.gap_filler is not None:
+            self.gap_filler.observe(res)
+
+        if self.log_level == "DEBUG":
+            logger.debug(f"\n{utils.pformat(res)}")
+
+        await self._dispatch(res)
+
+    async def _on_decoded(self, events, filtered):
+        self.filters.seen += len(events) + filtered
+        self.filters.filtered += filtered
+
+        for event in events:
+            if isinstance(event, dict) and event["event"] is EventType.reply:
+                self.subscriptions.on_reply(event)
+            if self.gap_filler is not None:
+                self.gap_filler.observe(event)
+
+            await self._dispatch(event)
+
+    def _on_reconnect(self, connection, disconnected_at, reconnected_at):
+        logger.warning(
+            f"Connection {connection.index} was down for "
+            f"{reconnected_at - disconnected_at:.1f}s"
+        )
+        self.outages.append((connection.index, disconnected_at, reconnected_at))
+        if self.gap_filler is None:
+            return
+
+        task = asyncio.create_task(
+            self.gap_filler.fill(
+                self, connection.subscriptions, disconnected_at, reconnected_at
+            )
+        )
+        self._gap_tasks.add(task)
+        task.add_done_callback(self._gap_tasks.discard)
+
+    def add_filter(self, f):
+        return self.filters.add(f)
+
+    def filter_stats(self) -> dict:
+        decode_time = self.decode_time / self.decoded if self.decoded else 0.0
+        return self.filters.stats(decode_time)
+
+    async def _send(self, obj, topic: str | None = None):
+        name = "" if topic is None else topic.split(":", 1)[-1]
+        await self.connection(name)._send(obj, topic)
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import itertools
+import time
+from enum import Enum
+
+from loguru import logger
+
+from .models.stream import Message
+from .models.types import EventType
+from .utils import jsonlib
+from .utils.retry import RetryPolicy
+
+
+class State(str, Enum):
+    joining = "joining"
+    joined = "joined"
+    failed = "failed"
+
+
+class Subscription:
+    __slots__ = ("name", "state", "ref", "attempts", "sent_at", "latency", "error")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.state = State.joining
+        self.ref = None
+        self.attempts = 0
+        self.sent_at = None
+        # seconds between sending the join and its reply
+        self.latency = None
+        self.error = None
+
+    def __repr__(self):
+        return (
+            f"Subscription({self.name!r}, {self.state.value}, latency={self.latency})"
+        )
+
+
+class SubscriptionManager:
+    # the collections of one stream, joins are pipelined with unique refs and
+    # every join waits for its phx_reply
+    def __init__(self, stream, timeout: float = 10.0, retry: RetryPolicy | None = None):
+        self.stream = stream
+        self.timeout = timeout
+        self.retry = RetryPolicy(max_retries=3) if retry is None else retry
+
+        self.subscriptions = {}
+
+        self._refs = itertools.count(1)
+        self._replies = {}
+        self._done = {}
+        self._tasks = set()
+
+    def __iter__(self):
+        return iter(list(self.subscriptions))
+
+    def __contains__(self, name):
+        return name in self.subscriptions
+
+    def __len__(self):
+        return len(self.subscriptions)
+
+    def __getitem__(self, name) -> Subscription:
+        return self.subscriptions[name]
+
+    @staticmethod
+    def frame(name, sub=True, ref=None) -> str:
+        req = Message(
+            topic=f"collection:{name}",
+            event=EventType.subscribe if sub else EventType.unsubscribe,
+            ref=ref,
+        )
+        return jsonlib.dumps(req.model_dump(mode="json"))
+
+    async def join(self, name) -> Subscription:
+        sub = self.subscriptions.get(name, None)
+        if sub is None:
+            sub = self.subscriptions[name] = Subscription(name)
+            self._done[name] = asyncio.Event()
+
+        sub.attempts = 0
+        await self._join(sub, self._send)
+        return sub
+
+    async def leave(self, name):
+        sub = self.subscriptions.pop(name, None)
+        if sub is not None:
+            self._replies.pop(sub.ref, None)
+            self._done.pop(name).set()
+
+        await self._send(name, self.frame(name, sub=False, ref=next(self._refs)))
+
+    async def rejoin(self, name, send):
+        # after a reconnect, send is the new socket's send
+        sub = self.subscriptions.get(name, None)
+        if sub is not None:
+            sub.attempts = 0
+            await self._join(sub, lambda name, frame: send(frame))
+
+    def interrupted(self, names):
+        for name in names:
+            sub = self.subscriptions.get(name, None)
+            if sub is not None and sub.state is State.joined:
+                sub.state = State.joining
+                self._done[name].clear()
+
+    async def wait(self, names=None, timeout: float | None = None) -> dict:
+        names = [n for n in (self if names is None else names) if n in self]
+        await asyncio.wait_for(
+            asyncio.gather(*(self._done[n].wait() for n in names)), timeout
+        )
+        return {n: self.subscriptions[n].state for n in names if n in self}
+
+    def on_reply(self, msg):
+        try:
+            future = self._replies.pop(int(msg.get("ref", None)), None)
+        except (TypeError, ValueError):
+            return
+
+        if future is not None and not future.done():
+            future.set_result(msg.get("payload", None) or {})
+
+    async def _send(self, name, frame):
+        await self.stream._send(frame, topic=f"collection:{name}")
+
+    async def _join(self, sub, send):
+        self._replies.pop(sub.ref, None)
+        self._done[sub.name].clear()
+
+        sub.state = State.joining
+        sub.ref = ref = next(self._refs)
+        sub.attempts += 1
+        sub.sent_at = time.perf_counter()
+
+        future = asyncio.get_running_loop().create_future()
+        self._replies[ref] = future
+        await send(sub.name, self.frame(sub.name, ref=ref))
+
+        task = asyncio.create_task(self._await_reply(sub, ref, future))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _current(self, sub, ref) -> bool:
+        return self.subscriptions.get(sub.name, None) is sub and sub.ref == ref
+
+    async def _await_reply(self, sub, ref, future):
+        # the timeout starts once the frame can actually be sent
+        connection = self.stream.connection(sub.name)
+        if not connection.ready.is_set():
+            await connection.ready.wait()
+            sub.sent_at = time.perf_counter()
+
+        try:
+            reply = await asyncio.wait_for(future, self.timeout)
+            error = None if reply.get("status", None) == "ok" else reply
+        except asyncio.TimeoutError:
+            error = "timeout"
+
+        if not self._current(sub, ref):
+            return
+
+        if error is None:
+            sub.state = State.joined
+            sub.latency = time.perf_counter() - sub.sent_at
+            sub.error = None
+            self._done[sub.name].set()
+            return
+
+        sub.error = error
+        if sub.attempts > self.retry.max_retries:
+            logger.error(f"Failed to join {sub.name}: {error}")
+            self._replies.pop(ref, None)
+            sub.state = State.failed
+            self._done[sub.name].set()
+            return
+
+        retry_in = self.retry.delay(sub.attempts - 1)
+        logger.warning(f"Failed to join {sub.name} ({error}), retry in: {retry_in}")
+        await asyncio.sleep(retry_in)
+        if self._current(sub, ref):
+            await self._join(sub, self._send)
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        states = {state.value: 0 for state in State}
+        latencies = []
+        for sub in self.subscriptions.values():
+            states[sub.state.value] += 1
+            if sub.state is State.joined:
+                latencies.append(sub.latency)
+
+        latency = sum(latencies) / len(latencies) if latencies else None
+        return {**states, "latency": latency}
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import time
+from collections import OrderedDict
+
+import httpx
+
+
+class ResponseCache:
+    # seconds, endpoints without a ttl are never cached
+    DEFAULT_TTLS = {
+        "contract": 24 * 60 * 60,
+        "collection": 10 * 60,
+        "nft": 10 * 60,
+    }
+
+    def __init__(
+        self,
+        max_size: int = 4096,
+        ttls: dict[str, float] | None = None,
+        negative_ttl: float | None = 60,
+    ):
+        self.max_size = max_size
+        self.ttls = self.DEFAULT_TTLS if ttls is None else ttls
+        self.negative_ttl = negative_ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: OrderedDict[str, tuple[float, httpx.Response]] = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(url, params=None) -> str:
+        return str(httpx.URL(url, params=params))
+
+    def cacheable(self, endpoint) -> bool:
+        return endpoint in self.ttls
+
+    def get(self, key) -> httpx.Response | None:
+        entry = self._entries.get(key, None)
+        if entry is not None:
+            expires, response = entry
+            if expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return response
+
+            del self._entries[key]
+
+        self.misses += 1
+        return None
+
+    def set(self, key, endpoint, response: httpx.Response):
+        if response.is_success:
+            ttl = self.ttls.get(endpoint, None)
+        elif response.status_code == 404:
+            ttl = self.negative_ttl
+        else:
+            ttl = None
+
+        if not ttl:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, response)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
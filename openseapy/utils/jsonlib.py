@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKENDS = ("auto", "orjson", "json")
+
+backend = None
+loads = json.loads
+dumps = json.dumps
+
+
+def _orjson_dumps(obj):
+    return orjson.dumps(obj).decode()
+
+
+def set_backend(name: str = "auto"):
+    global backend, loads, dumps
+
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown json backend: {name}\nAllowed Values: {BACKENDS}")
+
+    if name == "auto":
+        name = "json" if orjson is None else "orjson"
+
+    if name == "orjson":
+        if orjson is None:
+            raise ValueError("json backend 'orjson' is not installed")
+
+        loads, dumps = orjson.loads, _orjson_dumps
+    else:
+        loads, dumps = json.loads, json.dumps
+
+    backend = name
+
+
+set_backend(os.environ.get("OPENSEAPY_JSON", "auto"))
@@ -1,14 +1,26 @@
 import asyncio as aio
+import time
+import uuid
 from abc import ABC, abstractmethod
 
 from aioredis_semaphore import Semaphore
 
+from .retry import is_throttled, retry_after
+
 
 class RateLimiter(ABC):
     @abstractmethod
     async def limit(self, coro):
         ...
 
+    async def limit_key(self, coro, key=None):
+        # `key` names the endpoint, only limiters with per-endpoint buckets
+        # need to override this
+        return await self.limit(coro)
+
+    def feedback(self, response, key=None):
+        pass
+
 
 class FakeRateLimiter(RateLimiter):
     async def limit(self, coro):
@@ -28,6 +40,131 @@ class AsyncioRateLimiter(RateLimiter):
         return res
 
 
+class TokenBucket:
+    # GCRA, every acquire reserves the next free slot and returns how long to
+    # wait for it, so waiting never happens while holding anything
+    def __init__(self, rate: float, burst: int = 1):
+        assert rate > 0, "rate must be positive"
+        assert burst >= 1, "burst must be at least 1"
+
+        self.rate = rate
+        self.burst = burst
+        self._tat = 0.0
+
+    @property
+    def interval(self):
+        return 1 / self.rate
+
+    def reserve(self, now=None) -> float:
+        if now is None:
+            now = time.monotonic()
+
+        tat = max(self._tat, now) + self.interval
+        self._tat = tat
+
+        return max(0.0, tat - self.burst * self.interval - now)
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        buckets: dict[str, tuple[float, int]] | None = None,
+    ):
+        self.bucket = TokenBucket(rate, burst)
+        self.buckets = {
+            key: TokenBucket(rate_, burst_)
+            for key, (rate_, burst_) in (buckets or {}).items()
+        }
+
+    async def acquire(self, key=None):
+        now = time.monotonic()
+        delay = self.bucket.reserve(now)
+
+        bucket = self.buckets.get(key, None)
+        if bucket is not None:
+            delay = max(delay, bucket.reserve(now))
+
+        if delay > 0:
+            await aio.sleep(delay)
+
+    async def limit(self, coro):
+        return await self.limit_key(coro)
+
+    async def limit_key(self, coro, key=None):
+        try:
+            await self.acquire(key)
+        except BaseException:
+            coro.close()
+            raise
+
+        return await coro
+
+
+class AdaptiveRateLimiter(TokenBucketRateLimiter):
+    # AIMD, throttling halves the shared rate and pauses every caller until
+    # Retry-After, successful responses raise it again by `increase` at most
+    # once per `cooldown`, however many requests are made
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        buckets: dict[str, tuple[float, int]] | None = None,
+        min_rate: float = 0.5,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+        pause: float = 1.0,
+    ):
+        super().__init__(rate, burst, buckets)
+
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.pause = pause
+
+        self.throttled = 0
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._last_increase = float("-inf")
+
+    @property
+    def rate(self):
+        return self.bucket.rate
+
+    async def acquire(self, key=None):
+        while (delay := self._paused_until - time.monotonic()) > 0:
+            await aio.sleep(delay)
+
+        await super().acquire(key)
+
+    def feedback(self, response, key=None):
+        now = time.monotonic()
+
+        if not is_throttled(response):
+            last_change = max(self._last_decrease, self._last_increase)
+            if response.is_success and now - last_change >= self.cooldown:
+                self._last_increase = now
+                self.bucket.rate = min(self.max_rate, self.bucket.rate + self.increase)
+            return
+
+        self.throttled += 1
+        pause = retry_after(response)
+        self._paused_until = max(
+            self._paused_until, now + (self.pause if pause is None else pause)
+        )
+
+        # a burst of throttled responses counts as a single decrease
+        if now - self._last_decrease < self.cooldown:
+            return
+
+        self._last_decrease = now
+        self.bucket.rate = max(self.min_rate, self.bucket.rate * self.decrease)
+
+
 class AsyncRedisRateLimiter(RateLimiter):
     def __init__(self, redis, semaphore_value, redis_namespace, sleep_time=0):
         self.redis_namespace = redis_namespace
@@ -49,3 +186,85 @@ class AsyncRedisRateLimiter(RateLimiter):
             await aio.sleep(self.sleep_time)
 
         return res
+
+
+# KEYS: one sorted set per window, ARGV: member, then (limit, window_ms) per key
+# returns 0 if the request was admitted, otherwise the ms to wait
+SLIDING_WINDOW_SCRIPT = """
+local t = redis.call("TIME")
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local member = ARGV[1]
+
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[i * 2])
+    local window = tonumber(ARGV[i * 2 + 1])
+
+    redis.call("ZREMRANGEBYSCORE", key, "-inf", now - window)
+    if redis.call("ZCARD", key) >= limit then
+        local oldest = redis.call("ZRANGE", key, 0, 0, "WITHSCORES")
+        wait = math.max(wait, tonumber(oldest[2]) + window - now)
+    end
+end
+
+if wait > 0 then
+    return wait
+end
+
+for i, key in ipairs(KEYS) do
+    redis.call("ZADD", key, now, member)
+    redis.call("PEXPIRE", key, tonumber(ARGV[i * 2 + 1]))
+end
+
+return 0
+"""
+
+
+class AsyncRedisSlidingWindowRateLimiter(RateLimiter):
+    def __init__(
+        self,
+        redis,
+        limit: int,
+        window: float,
+        redis_namespace: str,
+        buckets: dict[str, tuple[int, float]] | None = None,
+    ):
+        self.redis = redis
+        self.redis_namespace = redis_namespace
+        self.window = (limit, window)
+        self.buckets = buckets or {}
+
+        self._script = redis.register_script(SLIDING_WINDOW_SCRIPT)
+
+    def _key(self, name):
+        # hash tag keeps all keys of a namespace in the same cluster slot
+        return f"{{{self.redis_namespace}}}:{name}"
+
+    async def acquire(self, key=None):
+        windows = {self._key("global"): self.window}
+        if key in self.buckets:
+            windows[self._key(key)] = self.buckets[key]
+
+        keys = list(windows)
+        args = [uuid.uuid4().hex]
+        for limit, window in windows.values():
+            args += [limit, int(window * 1000)]
+
+        while True:
+            wait = await self._script(keys=keys, args=args)
+            if not wait:
+                return
+
+            await aio.sleep(int(wait) / 1000)
+
+    async def limit(self, coro):
+        return await self.limit_key(coro)
+
+    async def limit_key(self, coro, key=None):
+        try:
+            await self.acquire(key)
+        except BaseException:
+            coro.close()
+            raise
+
+        return await coro
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import datetime as dt
+import random
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def retry_after(response: httpx.Response) -> float | None:
+    value = response.headers.get("Retry-After", None)
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, (date - dt.datetime.now(dt.timezone.utc)).total_seconds())
+
+
+def is_throttled(response: httpx.Response) -> bool:
+    return response.status_code in RETRY_STATUS_CODES
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_retries: int = 5,
+        base: float = 0.5,
+        cap: float = 30.0,
+        status_codes=RETRY_STATUS_CODES,
+        exceptions=(httpx.TransportError,),
+    ):
+        self.max_retries = max_retries
+        self.base = base
+        self.cap = cap
+        self.status_codes = status_codes
+        self.exceptions = exceptions
+
+    def should_retry(self, response: httpx.Response, attempt: int) -> bool:
+        return attempt < self.max_retries and response.status_code in self.status_codes
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        # exponential backoff with full jitter, but never before Retry-After
+        delay = random.uniform(0, min(self.cap, self.base * 2 ** min(attempt, 32)))
+        if response is not None:
+            delay = max(delay, retry_after(response) or 0.0)
+
+        return delay
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+
+class SingleFlight:
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def __len__(self):
+        return len(self._inflight)
+
+    async def do(self, key, make_coro):
+        fut = self._inflight.get(key, None)
+        if fut is None:
+            self.calls += 1
+            fut = asyncio.ensure_future(make_coro())
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda f: self._done(key, f))
+        else:
+            self.coalesced += 1
+
+        # a cancelled waiter must not cancel the request for everyone else
+        return await asyncio.shield(fut)
+
+    def _done(self, key, fut):
+        if self._inflight.get(key, None) is fut:
+            del self._inflight[key]
+
+        # retrieve the exception, in case every waiter is gone
+        if not fut.cancelled():
+            fut.exception()
+
+    def stats(self) -> dict:
+        return {
+            "inflight": len(self._inflight),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import httpx
+import pytest
+from openseapy import backfill
+from openseapy.backfill import split
+
+
+def test_split():
+    assert split(0, 10, 3) == [(0, 4), (4, 8), (8, 10)]
+    assert split(0, 2, 8) == [(0, 1), (1, 2)]
+
+
+@pytest.mark.asyncio
+async def test_backfill_merges_windows_in_order():
+    # one event per second, boundaries are inclusive on both sides
+    events = [{"event_type": "sale", "event_timestamp": t} for t in range(100)]
+    windows = set()
+
+    async def nft_events(*, after, before, cursor=None, limit=3):
+        windows.add((after, before))
+        page = [e for e in events if after <= e["event_timestamp"] <= before]
+        page.sort(key=lambda e: -e["event_timestamp"])
+
+        start = int(cursor or 0)
+        next_ = str(start + limit) if start + limit < len(page) else None
+        return httpx.Response(
+            200, json={"asset_events": page[start : start + limit], "next": next_}
+        )
+
+    res = [
+        e
+        async for e in backfill(
+            nft_events, after=0, before=99, windows=7, concurrency=3
+        )
+    ]
+
+    assert len(windows) == 7
+    assert [e["event_timestamp"] for e in res] == list(range(100))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [
+        httpx.Response(429, json={"detail": "Request was throttled."}),
+        httpx.Response(502, text="<html>Bad Gateway</html>"),
+    ],
+)
+async def test_backfill_raises_on_error_responses(error):
+    error.request = httpx.Request("GET", "https://api.opensea.io/events")
+
+    async def nft_events(*, after, before, cursor=None):
+        if after >= 50:
+            return error
+
+        events = [{"event_type": "sale", "event_timestamp": after}]
+        return httpx.Response(200, json={"asset_events": events, "next": None})
+
+    with pytest.raises(httpx.HTTPStatusError):
+        async for _ in backfill(nft_events, after=0, before=99, windows=2):
+            pass
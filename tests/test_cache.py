@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import httpx
+import pytest
+from openseapy import Client, OpenSea, ResponseCache
+
+
+def _api(handler, cache):
+    client = Client(transport=httpx.MockTransport(handler))
+    return OpenSea(test=True, log_level=None, client=client, cache=cache).api
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_and_negative_caching():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if request.url.path.endswith("missing"):
+            return httpx.Response(404)
+        return httpx.Response(200, json={"collection": "slug"})
+
+    cache = ResponseCache()
+    api = _api(handler, cache)
+
+    for _ in range(3):
+        await api.collection("slug")
+        res = await api.collection("missing")
+        assert res.status_code == 404
+
+    # stats are not cached
+    await api.collection_stats("slug")
+    await api.collection_stats("slug")
+
+    assert len(calls) == 4
+    assert cache.stats() == {"size": 2, "hits": 4, "misses": 2, "evictions": 0}
+
+
+def test_cache_lru_eviction():
+    cache = ResponseCache(max_size=2)
+    for key in "abc":
+        cache.get("a")
+        cache.set(key, "nft", httpx.Response(200))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.evictions == 1
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import httpx
+import pytest
+from openseapy import Client, OpenSea, paginate
+
+
+def _transport(calls):
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused():
+    calls = []
+    client = Client(transport=_transport(calls))
+
+    await client.get("https://api.opensea.io/a")
+    pool = client.client
+    await client.get("https://api.opensea.io/b")
+
+    assert client.client is pool
+    assert len(calls) == 2
+
+    await client.aclose()
+    assert pool.is_closed
+
+
+@pytest.mark.asyncio
+async def test_opensea_context_manager_closes_client():
+    calls = []
+    client = Client(transport=_transport(calls))
+
+    async with OpenSea(test=True, log_level=None, client=client) as os_:
+        res = await os_.api.collection("slug")
+        assert res.json() == {"ok": True}
+        pool = client.client
+
+    assert pool.is_closed
+    assert calls[0].url.path == "/api/v2/collections/slug"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_nfts_bulk(ordered):
+    async def handler(request):
+        token_id = int(request.url.path.rsplit("/", 1)[-1])
+        await asyncio.sleep(0.001 * (10 - token_id))
+        if token_id == 3:
+            return httpx.Response(404)
+        return httpx.Response(200, json={"nft": {"identifier": str(token_id)}})
+
+    client = Client(transport=httpx.MockTransport(handler))
+    api = OpenSea(test=True, log_level=None, client=client).api
+
+    identifiers = (("ethereum", "0xabc", str(i)) for i in range(10))
+    results = [r async for r in api.nfts(identifiers, concurrency=4, ordered=ordered)]
+
+    token_ids = [r.identifier[2] for r in results]
+    if ordered:
+        assert token_ids == [str(i) for i in range(10)]
+    assert sorted(token_ids, key=int) == [str(i) for i in range(10)]
+
+    failed = [r for r in results if not r.ok]
+    assert len(failed) == 1
+    assert failed[0].response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_nfts_ordered_bounds_run_ahead():
+    head = asyncio.Event()
+    started = []
+
+    async def handler(request):
+        token_id = int(request.url.path.rsplit("/", 1)[-1])
+        started.append(token_id)
+        if token_id == 0:
+            await head.wait()
+        return httpx.Response(200, json={"nft": {"identifier": str(token_id)}})
+
+    client = Client(transport=httpx.MockTransport(handler))
+    api = OpenSea(test=True, log_level=None, client=client).api
+
+    identifiers = (("ethereum", "0xabc", str(i)) for i in range(1000))
+    results = api.nfts(identifiers, concurrency=2, ordered=True)
+    first = asyncio.create_task(results.__anext__())
+
+    # the head of line request blocks, the others only run 4 * concurrency ahead
+    await asyncio.sleep(0.2)
+    assert len(started) == 8
+
+    head.set()
+    assert (await first).identifier[2] == "0"
+    rest = [r.identifier[2] async for r in results]
+    assert rest == [str(i) for i in range(1, 1000)]
+
+
+@pytest.mark.asyncio
+async def test_typed_pagination():
+    def handler(request):
+        cursor = request.url.params.get("next") or "0"
+        next_ = None if cursor == "1" else "1"
+        nft = {
+            "identifier": cursor,
+            "collection": "slug",
+            "contract": "0xabc",
+            "token_standard": "erc721",
+        }
+        return httpx.Response(200, json={"nfts": [nft], "next": next_})
+
+    client = Client(transport=httpx.MockTransport(handler))
+    api = OpenSea(test=True, log_level=None, client=client).api
+
+    pages = [page async for page in paginate(api.typed.nfts_by_collection, "slug")]
+
+    assert [page.nfts[0].identifier for page in pages] == ["0", "1"]
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import json
+
+import httpx
+import pytest
+from openseapy import CollectionCrawler
+
+
+class API:
+    def __init__(self, pages, fail_at=None, throttle_at=None):
+        self.pages = pages
+        self.fail_at = fail_at
+        self.throttle_at = throttle_at
+        self.cursors = []
+
+    async def nfts_by_collection(self, slug, limit=50, cursor=""):
+        self.cursors.append(cursor)
+        i = int(cursor or 0)
+        if i == self.fail_at:
+            raise httpx.ConnectError("boom")
+        if i == self.throttle_at:
+            request = httpx.Request("GET", "https://api.opensea.io/nfts")
+            return httpx.Response(
+                429, json={"detail": "Request was throttled."}, request=request
+            )
+
+        next_ = str(i + 1) if i + 1 < self.pages else None
+        nfts = [{"identifier": f"{i}-{j}"} for j in range(2)]
+        return httpx.Response(200, json={"nfts": nfts, "next": next_})
+
+
+@pytest.mark.asyncio
+async def test_crawler_resumes_from_checkpoint(tmp_path):
+    sink = str(tmp_path / "nfts.ndjson")
+
+    with pytest.raises(httpx.ConnectError):
+        await CollectionCrawler(API(5, fail_at=3), "slug", sink, prefetch=0).run()
+
+    # a partial write after the last checkpoint is discarded on resume
+    with open(sink, "a") as f:
+        f.write('{"identifier": "partial"')
+
+    api = API(5)
+    state = await CollectionCrawler(api, "slug", sink, prefetch=0).run()
+
+    assert api.cursors == ["3", "4"]
+    assert state["done"] and state["pages"] == 5 and state["items"] == 10
+
+    with open(sink) as f:
+        ids = [json.loads(line)["identifier"] for line in f]
+    assert ids == [f"{i}-{j}" for i in range(5) for j in range(2)]
+
+    # finished crawls are not repeated
+    api = API(5)
+    await CollectionCrawler(api, "slug", sink).run()
+    assert api.cursors == []
+
+
+@pytest.mark.asyncio
+async def test_crawler_stops_on_error_responses(tmp_path):
+    sink = str(tmp_path / "nfts.ndjson")
+
+    # a throttled page must not be taken for the last one
+    with pytest.raises(httpx.HTTPStatusError):
+        await CollectionCrawler(API(5, throttle_at=2), "slug", sink).run()
+
+    api = API(5)
+    state = await CollectionCrawler(api, "slug", sink, prefetch=0).run()
+
+    assert api.cursors == ["2", "3", "4"]
+    assert state["done"] and state["pages"] == 5 and state["items"] == 10
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+
+import pytest
+from openseapy import DecodePool, EventFilter
+from openseapy.decode_pool import decode_batch
+
+from .frames import item_listed
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_blocks_put():
+    gate = asyncio.Event()
+    received = []
+
+    async def on_events(events, filtered):
+        await gate.wait()
+        received.extend(events)
+
+    pool = DecodePool(processes=1, batch_size=1, max_inflight=1)
+    pool.start(on_events)
+
+    frame = json.dumps(item_listed())
+    await pool.put(frame)
+
+    # the first batch is decoded but not delivered, its slot is still held
+    put = asyncio.create_task(pool.put(frame))
+    await asyncio.sleep(0.5)
+    assert not put.done()
+    assert pool.stats()["inflight"] == 1
+
+    gate.set()
+    await put
+    await pool.join()
+    await pool.stop()
+
+    assert len(received) == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_blocks_put_below_batch_size():
+    gate = asyncio.Event()
+    received = []
+
+    async def on_events(events, filtered):
+        await gate.wait()
+        received.extend(events)
+
+    # batches never fill up, every one is flushed by the latency timer
+    pool = DecodePool(processes=1, batch_size=100, batch_latency=0.01, max_inflight=1)
+    pool.start(on_events)
+
+    frame = json.dumps(item_listed())
+    puts = 0
+
+    async def feed():
+        nonlocal puts
+        for _ in range(50):
+            await pool.put(frame)
+            puts += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(feed())
+    await asyncio.sleep(0.5)
+    assert not task.done()
+    assert pool.stats()["inflight"] == 1
+    blocked = puts
+    await asyncio.sleep(0.1)
+    assert puts == blocked
+
+    gate.set()
+    await task
+    await pool.join()
+    await pool.stop()
+
+    assert len(received) == 50
+
+
+def test_bad_frames_only_fail_themselves():
+    def broken(raw):
+        if raw["payload"]["payload"]["collection"]["slug"] == "broken":
+            raise KeyError("broken")
+        return True
+
+    other = item_listed()
+    other["payload"]["payload"]["collection"]["slug"] = "broken"
+    frames = [json.dumps(item_listed()), "{not json", json.dumps(other)]
+
+    events, filtered, failed = decode_batch(frames, (broken,))
+
+    assert len(events) == 1
+    assert (filtered, failed) == (0, 2)
+
+
+@pytest.mark.asyncio
+async def test_filters_can_change_after_start():
+    received = []
+
+    async def on_events(events, filtered):
+        received.append((len(events), filtered))
+
+    filters = []
+    pool = DecodePool(processes=1, batch_size=1)
+    pool.start(on_events, filters)
+
+    frame = json.dumps(item_listed())
+    await pool.put(frame)
+    await pool.join()
+
+    filters.append(EventFilter(exclude_slugs=["stub"]))
+    await pool.put(frame)
+    await pool.join()
+
+    filters.clear()
+    await pool.put(frame)
+    await pool.join()
+    await pool.stop()
+
+    assert received == [(1, 0), (0, 1), (1, 0)]
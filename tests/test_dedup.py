@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import time
+
+from openseapy import Deduplicator
+from openseapy.models.compact import CompactEvent
+
+from .frames import item_listed
+
+
+def test_dedup_window_and_size(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    dedup = Deduplicator(window=10, max_size=2, key=lambda msg: msg)
+
+    assert dedup("a")
+    assert not dedup("a")
+    assert dedup("b")
+    # "a" is evicted to stay within max_size
+    assert dedup("c")
+    assert dedup("a")
+
+    now[0] = 11
+    assert dedup("c")
+    assert dedup.suppressed == 1
+
+
+def test_dedup_keys():
+    dedup = Deduplicator()
+
+    assert dedup(item_listed())
+    assert not dedup(item_listed())
+    assert dedup(CompactEvent.from_frame(item_listed()))
+    assert not dedup(CompactEvent.from_frame(item_listed()))
+
+    reply = {"event": "phx_reply", "payload": {"status": "ok"}}
+    assert dedup(reply) and dedup(reply)
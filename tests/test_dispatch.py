@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+from openseapy import Dispatcher, Overflow, ShardedDispatcher
+from openseapy.dispatch import Batcher
+
+
+def _handler(seen, release):
+    async def handler(msg):
+        await release.wait()
+        seen.append(msg)
+
+    return handler
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "overflow,expected",
+    [
+        (Overflow.drop_newest, [0, 1, 2]),
+        (Overflow.drop_oldest, [0, 3, 4]),
+    ],
+)
+async def test_dispatcher_overflow(overflow, expected):
+    seen, release = [], asyncio.Event()
+    dispatcher = Dispatcher(maxsize=2, workers=1, overflow=overflow)
+    dispatcher.start(_handler(seen, release))
+
+    await dispatcher.put(0)
+    await asyncio.sleep(0)  # worker picks up 0 and blocks
+    for i in range(1, 5):
+        await dispatcher.put(i)
+
+    assert dispatcher.depth == 2
+    assert dispatcher.dropped == 2
+
+    release.set()
+    await dispatcher.join()
+    await dispatcher.stop()
+
+    assert seen == expected
+    assert dispatcher.stats() == {
+        "depth": 0,
+        "maxsize": 2,
+        "processed": 3,
+        "dropped": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_blocks_when_full():
+    seen, release = [], asyncio.Event()
+    dispatcher = Dispatcher(maxsize=1, workers=1)
+    dispatcher.start(_handler(seen, release))
+
+    await dispatcher.put(0)
+    await asyncio.sleep(0)
+    await dispatcher.put(1)
+
+    put = asyncio.create_task(dispatcher.put(2))
+    await asyncio.sleep(0.01)
+    assert not put.done()
+
+    release.set()
+    await put
+    await dispatcher.join()
+    await dispatcher.stop()
+
+    assert seen == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_sharded_dispatcher_keeps_order_per_key():
+    seen = {}
+
+    async def handler(msg):
+        # later events for a key finish faster, unordered dispatch would reorder
+        await asyncio.sleep(0.001 * (5 - msg["i"]))
+        seen.setdefault(msg["key"], []).append(msg["i"])
+
+    dispatcher = ShardedDispatcher(key=lambda msg: msg["key"], workers=4)
+    dispatcher.start(handler)
+
+    for i in range(5):
+        for key in "abcdef":
+            await dispatcher.put({"key": key, "i": i})
+
+    await dispatcher.join()
+    await dispatcher.stop()
+
+    assert seen == {key: [0, 1, 2, 3, 4] for key in "abcdef"}
+    assert dispatcher.processed == 30
+
+
+def test_sharded_dispatcher_keys():
+    msg = {
+        "event": "item_listed",
+        "payload": {
+            "payload": {
+                "collection": {"slug": "stub"},
+                "item": {"nft_id": "ethereum/0xabc/1"},
+            }
+        },
+    }
+    reply = {"event": "phx_reply", "payload": {"status": "ok"}}
+
+    assert ShardedDispatcher(key="nft_id").key(msg) == "ethereum/0xabc/1"
+    assert ShardedDispatcher(key="slug").key(msg) == "stub"
+    assert ShardedDispatcher(key="slug").key(reply) is None
+
+
+@pytest.mark.asyncio
+async def test_batcher_flushes_one_batch_at_a_time():
+    active, overlap, batches = 0, 0, []
+
+    async def handler(batch):
+        nonlocal active, overlap
+        active += 1
+        overlap = max(overlap, active)
+        await asyncio.sleep(0.05)
+        batches.append(batch)
+        active -= 1
+
+    batcher = Batcher(handler, size=3, latency=0.01)
+
+    # the timed flush of [0, 1] is still running when [2, 3, 4] fills up
+    await batcher.add(0)
+    await batcher.add(1)
+    await asyncio.sleep(0.02)
+    for i in range(2, 8):
+        await batcher.add(i)
+    await batcher.flush()
+
+    assert overlap == 1
+    assert [i for batch in batches for i in batch] == list(range(8))
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+from openseapy.event import OpenSeaEvent
+
+from .frames import item_listed
+
+
+@pytest.mark.asyncio
+async def test_batch_handlers():
+    events = OpenSeaEvent(batch_size=2, batch_latency=0.05)
+    single, batches = [], []
+
+    @events.event
+    async def on_item_listed(msg):
+        single.append(msg)
+
+    @events.event
+    async def on_item_listed_batch(msgs):
+        batches.append([msg.payload.collection.slug for msg in msgs])
+
+    for _ in range(5):
+        await events._distribute(item_listed())
+
+    assert len(single) == 5
+    assert batches == [["stub", "stub"], ["stub", "stub"]]
+
+    # the rest is flushed by latency
+    await asyncio.sleep(0.1)
+    assert batches[-1] == ["stub"]
+
+
+def test_unknown_batch_handler():
+    events = OpenSeaEvent()
+
+    with pytest.raises(ValueError):
+
+        @events.event
+        async def on_reply_batch(msgs):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_skip_batch():
+    events = OpenSeaEvent(batch_size=1)
+    batches = []
+
+    @events.event
+    async def on_item_listed(msg):
+        raise RuntimeError("handler failed")
+
+    @events.event
+    async def on_item_listed_batch(msgs):
+        batches.append(msgs)
+
+    await events._distribute(item_listed())
+
+    assert len(batches) == 1
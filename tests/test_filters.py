@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+from openseapy import EventFilter
+from openseapy.filters import FilterRegistry
+from openseapy.models.types import EventType
+
+from .frames import item_listed
+
+REPLY = {"event": "phx_reply", "topic": "x", "ref": 0, "payload": {"status": "ok"}}
+
+
+def test_event_filter():
+    raw = item_listed()
+
+    assert EventFilter(slugs=["stub"])(raw)
+    assert not EventFilter(slugs=["other"])(raw)
+    assert not EventFilter(exclude_slugs=["stub"])(raw)
+    assert EventFilter(event_types=[EventType.item_listed])(raw)
+    assert not EventFilter(event_types=["item_sold"])(raw)
+    assert EventFilter(chains=["ethereum"])(raw)
+    assert not EventFilter(chains=["matic"])(raw)
+
+    # 1.25 ETH
+    assert EventFilter(min_price=1, max_price=2)(raw)
+    assert not EventFilter(min_price=1.5)(raw)
+    assert not EventFilter(max_price=1)(raw)
+
+    # replies are never filtered
+    assert EventFilter(slugs=[], event_types=[])(REPLY)
+
+
+def test_filter_registry_stats():
+    registry = FilterRegistry()
+    assert registry(item_listed())
+
+    registry.add(EventFilter(slugs=["other"]))
+    assert not registry(item_listed())
+    assert registry(REPLY)
+
+    stats = registry.stats(decode_time=1.0)
+    assert stats["seen"] == 2
+    assert stats["filtered"] == 1
+    assert 0.9 < stats["saved_time"] <= 1.0
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+from openseapy.gap_fill import GapFiller, gap_key
+from openseapy.models.compact import CompactEvent
+
+from .frames import item_listed
+
+LISTING = {
+    "event_type": "order",
+    "order_type": "listing",
+    "event_timestamp": 1698840000,
+    "chain": "ethereum",
+    "asset": {
+        "identifier": "1234",
+        "contract": "0x495F947276749Ce646f68AC8c248420045cb7b5e",
+    },
+}
+
+
+def test_stream_and_rest_events_share_a_key():
+    key = ("listing", "ethereum", "0x495f947276749ce646f68ac8c248420045cb7b5e")
+    key += ("1234", 1698840000)
+
+    assert gap_key(item_listed()) == key
+    assert gap_key(CompactEvent.from_frame(item_listed())) == key
+    assert gap_key(LISTING) == key
+
+    assert gap_key({**LISTING, "order_type": "item_offer"}) != key
+    assert gap_key({"event_type": "sale"}) is None
+
+
+def test_unparseable_events_have_no_key():
+    short = item_listed()
+    short["payload"]["payload"]["item"]["nft_id"] = "ethereum/1234"
+    bad_time = item_listed()
+    bad_time["payload"]["payload"]["event_timestamp"] = "yesterday"
+    unknown = {**item_listed(), "event": "item_unknown"}
+
+    for msg in (short, bad_time, unknown, {**LISTING, "event_timestamp": "x"}):
+        assert gap_key(msg) is None
+
+    # and observing them doesn't raise
+    filler = GapFiller(api=None)
+    for msg in (short, bad_time, unknown, None):
+        filler.observe(msg)
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+import pytest
+from openseapy.utils import jsonlib
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_backends_roundtrip(backend):
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+
+    previous = jsonlib.backend
+    try:
+        jsonlib.set_backend(backend)
+
+        obj = {"event": "phx_join", "ref": 1, "payload": {}}
+        assert jsonlib.backend == backend
+        assert jsonlib.loads(jsonlib.dumps(obj)) == obj
+        assert isinstance(jsonlib.dumps(obj), str)
+    finally:
+        jsonlib.set_backend(previous)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        jsonlib.set_backend("simplejson")
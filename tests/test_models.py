@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+import copy
+import pickle
+
+import pytest
+from openseapy.models.compact import CompactEvent
+from openseapy.models.stream import (
+    PAYLOAD_VALIDATORS,
+    Collection,
+    Item,
+    ItemListedEvent,
+    LazyMessage,
+    Message,
+)
+from openseapy.models.types import EventType
+from pydantic import ValidationError
+
+from .frames import item_listed
+
+
+def test_lazy_message_validates_on_access():
+    raw = item_listed()
+    raw["payload"]["payload"]["maker"] = {"no": "address"}
+
+    msg = LazyMessage(raw)
+
+    assert msg.event == EventType.item_listed
+    assert msg.payload.collection == Collection(slug="stub")
+    assert msg.payload.base_price == "1250000000000000000"
+    assert isinstance(msg.payload.item, Item)
+    assert msg.payload.item.token_id == "1234"
+
+    # broken fields only fail once they are used
+    with pytest.raises(ValidationError):
+        msg.payload.maker
+
+    with pytest.raises(AttributeError):
+        msg.payload.unknown
+
+
+def test_lazy_payload_copy():
+    payload = LazyMessage(item_listed()).payload
+
+    payload_ = copy.copy(payload)
+
+    assert payload_.collection == Collection(slug="stub")
+    with pytest.raises(AttributeError):
+        payload_._missing
+
+
+def test_lazy_message_without_payload_model():
+    msg = LazyMessage({"event": "phx_reply", "topic": "x", "ref": 1, "payload": {}})
+
+    assert msg.payload == {}
+
+
+def test_message_decodes_payload_once(monkeypatch):
+    calls = []
+    validator = PAYLOAD_VALIDATORS[EventType.item_listed]
+
+    class Counting:
+        def validate_python(self, payload):
+            calls.append(payload)
+            return validator.validate_python(payload)
+
+    monkeypatch.setitem(PAYLOAD_VALIDATORS, EventType.item_listed, Counting())
+
+    for msg in (Message.decode(item_listed()), Message(**item_listed())):
+        assert msg.event == EventType.item_listed
+        assert isinstance(msg.payload, ItemListedEvent)
+        assert msg.payload.item.token_address == (
+            "0x495f947276749ce646f68ac8c248420045cb7b5e"
+        )
+
+    assert len(calls) == 2
+
+
+def test_message_without_payload_model():
+    msg = Message(topic="collection:slug", event=EventType.subscribe, ref=0)
+
+    assert msg.payload == {}
+    assert msg.model_dump(mode="json")["event"] == "phx_join"
+
+
+def test_compact_event():
+    event = CompactEvent.from_frame(item_listed())
+
+    assert event.event == EventType.item_listed
+    assert event.slug == "stub"
+    assert event.chain == "ethereum"
+    assert event.contract == "0x495f947276749ce646f68ac8c248420045cb7b5e"
+    assert event.token_id == 1234
+    assert event.price == 1_250_000_000_000_000_000
+    assert event.value == 1.25
+    assert event.maker == "0x2066ab6aa45120e5db70ab618b58ae126b0cbe04"
+    assert event.taker is None
+    assert event.nft_id == item_listed()["payload"]["payload"]["item"]["nft_id"]
+    assert not hasattr(event, "__dict__")
+
+    assert pickle.loads(pickle.dumps(event)) == event
+
+
+def test_compact_event_odd_nft_ids():
+    mint = "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
+    solana = item_listed()
+    solana["payload"]["payload"]["item"]["nft_id"] = f"solana/{mint}/{mint}"
+    event = CompactEvent.from_frame(solana)
+    assert event.token_id == mint
+    assert event.nft_id == f"solana/{mint}/{mint}"
+
+    short = item_listed()
+    short["payload"]["payload"]["item"]["nft_id"] = "1234"
+    event = CompactEvent.from_frame(short)
+    assert (event.chain, event.contract, event.token_id) == ("ethereum", None, 1234)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from contextlib import aclosing
+
+import httpx
+import pytest
+from openseapy import PaginationStats, paginate
+
+
+def _fetch(pages, delay):
+    async def f(cursor=""):
+        await asyncio.sleep(delay)
+        i = int(cursor or 0)
+        next_ = str(i + 1) if i + 1 < pages else None
+        return httpx.Response(200, json={"page": i, "next": next_})
+
+    return f
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [0, 2])
+async def test_paginate(prefetch):
+    pages = [
+        page["page"]
+        async for page in paginate(_fetch(5, 0), prefetch=prefetch, parse=True)
+    ]
+
+    assert pages == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_paginate_prefetch_overlaps_consumer():
+    stats = PaginationStats()
+    async for _ in paginate(_fetch(5, 0.05), prefetch=1, stats=stats):
+        await asyncio.sleep(0.05)
+
+    assert stats.pages == 5
+    # only the first page is waited for in full
+    assert stats.network_wait < 0.15
+    assert stats.consumer_time >= 0.25
+
+
+@pytest.mark.asyncio
+async def test_paginate_prefetch_stops_on_break():
+    async with aclosing(paginate(_fetch(100, 0), prefetch=3)) as pages:
+        async for res in pages:
+            if res.json()["page"] == 2:
+                break
+
+    await asyncio.sleep(0)
+    assert len(asyncio.all_tasks()) == 1
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import time
+
+import httpx
+import pytest
+from openseapy import (
+    AdaptiveRateLimiter,
+    AsyncRedisSlidingWindowRateLimiter,
+    Client,
+    OpenSea,
+    RetryPolicy,
+    TokenBucketRateLimiter,
+)
+from openseapy.utils.rate_limiter import RateLimiter, TokenBucket
+
+
+def test_token_bucket_burst_then_rate():
+    bucket = TokenBucket(rate=10, burst=3)
+
+    delays = [bucket.reserve(now=100.0) for _ in range(5)]
+
+    assert delays[:3] == [0, 0, 0]
+    assert delays[3] == pytest.approx(0.1)
+    assert delays[4] == pytest.approx(0.2)
+
+
+def test_token_bucket_refills():
+    bucket = TokenBucket(rate=10, burst=2)
+    for _ in range(4):
+        bucket.reserve(now=0.0)
+
+    assert bucket.reserve(now=10.0) == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_rate_limiter_per_endpoint():
+    limiter = TokenBucketRateLimiter(100, burst=100, buckets={"nft": (20, 1)})
+
+    async def req():
+        return time.monotonic()
+
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.limit_key(req(), key="nft") for _ in range(5)))
+
+    # 5 requests at 20 rps with a burst of one
+    assert time.monotonic() - start >= 0.19
+
+
+@pytest.mark.asyncio
+async def test_redis_sliding_window():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+
+    redis = fakeredis.FakeAsyncRedis()
+    limiter = AsyncRedisSlidingWindowRateLimiter(
+        redis, limit=3, window=0.2, redis_namespace="test"
+    )
+
+    async def req():
+        return time.monotonic()
+
+    start = time.monotonic()
+    res = await asyncio.gather(*(limiter.limit(req()) for _ in range(4)))
+
+    assert sorted(res)[2] - start < 0.1
+    assert sorted(res)[3] - start >= 0.19
+
+    ttl = await redis.pttl("{test}:global")
+    assert 0 < ttl <= 200
+
+
+def test_adaptive_rate_limiter_aimd(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    limiter = AdaptiveRateLimiter(10, min_rate=1, increase=1, cooldown=60)
+
+    throttled = httpx.Response(429, headers={"Retry-After": "2"})
+    limiter.feedback(throttled)
+    limiter.feedback(throttled)
+
+    # one burst of 429s only decreases the rate once
+    assert limiter.rate == 5
+    assert limiter.throttled == 2
+    assert limiter._paused_until - now == 2
+
+    # a burst of successes doesn't restore the rate at once
+    for _ in range(200):
+        limiter.feedback(httpx.Response(200))
+    assert limiter.rate == 5
+
+    # it recovers by `increase` per `cooldown`
+    now += 60
+    for _ in range(200):
+        limiter.feedback(httpx.Response(200))
+    assert limiter.rate == 6
+
+    now += 60 * 10
+    limiter.feedback(httpx.Response(200))
+    assert limiter.rate == 7
+
+
+@pytest.mark.asyncio
+async def test_retry_on_throttle():
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(503),
+        httpx.Response(200, json={"ok": True}),
+    ]
+    client = Client(transport=httpx.MockTransport(lambda _: responses.pop(0)))
+    os_ = OpenSea(
+        test=True,
+        log_level=None,
+        client=client,
+        retry=RetryPolicy(base=0.01),
+        rate_limiter=AdaptiveRateLimiter(100, burst=10, pause=0),
+    )
+
+    res = await os_.api.collection("slug")
+
+    assert res.status_code == 200
+    assert os_.api._rate_limiter.throttled == 2
+
+
+@pytest.mark.asyncio
+async def test_custom_rate_limiter_without_key():
+    class CountingRateLimiter(RateLimiter):
+        calls = 0
+
+        async def limit(self, coro):
+            self.calls += 1
+            return await coro
+
+    limiter = CountingRateLimiter()
+    client = Client(transport=httpx.MockTransport(lambda _: httpx.Response(200)))
+    os_ = OpenSea(test=True, log_level=None, client=client, rate_limiter=limiter)
+
+    res = await os_.api.collection("slug")
+
+    assert res.status_code == 200
+    assert limiter.calls == 1
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import httpx
+import pytest
+from openseapy import Client, OpenSea
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_coalesced():
+    calls = []
+    release = asyncio.Event()
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await release.wait()
+        return httpx.Response(200, json={"slug": "slug"})
+
+    client = Client(transport=httpx.MockTransport(handler))
+    api = OpenSea(test=True, log_level=None, client=client).api
+
+    waiters = [asyncio.create_task(api.collection("slug")) for _ in range(10)]
+    other = asyncio.create_task(api.collection("other"))
+    await asyncio.sleep(0.01)
+
+    # cancelling one waiter does not affect the others
+    waiters[0].cancel()
+    release.set()
+
+    res = await asyncio.gather(*waiters[1:], other)
+
+    assert all(r.json() == {"slug": "slug"} for r in res[:-1])
+    assert sorted(calls) == ["/api/v2/collections/other", "/api/v2/collections/slug"]
+    assert api.single_flight.stats() == {"inflight": 0, "calls": 2, "coalesced": 9}
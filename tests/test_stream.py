@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+
+import httpx
+import pytest
+import pytest_asyncio
+import websockets
+from openseapy import DecodePool, Deduplicator, EventFilter, GapFiller
+from openseapy.models.compact import CompactEvent
+from openseapy.stream import OpenSeaStream
+from openseapy.subscriptions import State
+from openseapy.utils.retry import RetryPolicy
+
+from .frames import item_listed
+
+
+class Server:
+    def __init__(self):
+        self.connections = []
+        self.received = []
+        # topics whose joins are rejected
+        self.rejected = set()
+
+    async def handler(self, ws):
+        self.connections.append(ws)
+        async for msg in ws:
+            msg = json.loads(msg)
+            self.received.append((ws, msg))
+
+            if msg["event"] == "phx_join":
+                status = "error" if msg["topic"] in self.rejected else "ok"
+                reply = {"status": status, "response": {}}
+                await ws.send(
+                    json.dumps({**msg, "event": "phx_reply", "payload": reply})
+                )
+
+    async def broadcast(self, frame):
+        for ws in self.connections:
+            await ws.send(json.dumps(frame))
+
+    def joins(self, ws=None):
+        return [
+            msg["topic"]
+            for ws_, msg in self.received
+            if msg["event"] == "phx_join" and ws in (None, ws_)
+        ]
+
+
+@pytest_asyncio.fixture
+async def server():
+    server = Server()
+    async with websockets.serve(server.handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        server.url = f"ws://127.0.0.1:{port}"
+        yield server
+
+
+async def wait_for(predicate, timeout=2):
+    async def wait():
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(wait(), timeout)
+
+
+def make_stream(server, **kwargs):
+    stream = OpenSeaStream("", test=True, log_level=None, **kwargs)
+    stream.url = server.url
+    return stream
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_are_spread_over_connections(server):
+    stream = make_stream(server, connections=3)
+    received = []
+
+    @stream.event
+    async def on_item_listed(msg):
+        received.append(msg)
+
+    await stream.start()
+    await wait_for(lambda: len(server.connections) == 3)
+
+    slugs = [f"slug-{i}" for i in range(12)]
+    for slug in slugs:
+        await stream.collection(slug)
+    await wait_for(lambda: len(server.joins()) == len(slugs))
+
+    # every join went over the connection its slug is sharded to
+    for connection in stream.connections:
+        local = connection.ws.local_address
+        ws = next(ws for ws in server.connections if ws.remote_address == local)
+
+        topics = server.joins(ws)
+        assert topics
+        assert all(stream.connection(t.split(":")[1]) is connection for t in topics)
+
+    # all connections feed the same handlers
+    await server.broadcast(item_listed())
+    await wait_for(lambda: len(received) == 3)
+
+    await stream.stop()
+
+
+@pytest.mark.asyncio
+async def test_decode_pool(server):
+    stream = make_stream(server, decode_pool=DecodePool(processes=1, batch_size=2))
+    stream.add_filter(EventFilter(exclude_slugs=["other"]))
+    received = []
+
+    @stream.event
+    async def on_item_listed(msg):
+        received.append(msg)
+
+    await stream.start()
+    await wait_for(lambda: len(server.connections) == 1)
+
+    other = item_listed()
+    other["payload"]["payload"]["collection"]["slug"] = "other"
+    for frame in (item_listed(), other, item_listed()):
+        await server.broadcast(frame)
+
+    await wait_for(lambda: len(received) == 2, timeout=10)
+    await stream.stop()
+
+    assert all(isinstance(msg, CompactEvent) for msg in received)
+    assert received[0].slug == "stub"
+    assert stream.filters.filtered == 1
+    assert stream.decode_pool.stats()["events"] == 2
+
+
+@pytest.mark.asyncio
+async def test_dedup_across_connections(server):
+    # two connections subscribed to the same firehose see every event twice
+    stream = make_stream(server, connections=2, dedup=Deduplicator())
+    received = []
+
+    @stream.event
+    async def on_item_listed(msg):
+        received.append(msg)
+
+    await stream.start()
+    await wait_for(lambda: len(server.connections) == 2)
+
+    other = item_listed()
+    other["payload"]["payload"]["maker"]["address"] = "0xother"
+    for frame in (item_listed(), other):
+        await server.broadcast(frame)
+
+    await wait_for(lambda: stream.dedup.seen == 4)
+    await stream.stop()
+
+    assert len(received) == 2
+    assert stream.dedup.stats() == {"size": 2, "seen": 4, "suppressed": 2}
+
+
+@pytest.mark.asyncio
+async def test_gap_is_filled_after_reconnect(server):
+    sale = {
+        "event_type": "sale",
+        "event_timestamp": 1698840001,
+        "chain": "ethereum",
+        "transaction": "0x1",
+    }
+    listing = {
+        "event_type": "order",
+        "order_type": "listing",
+        "event_timestamp": 1698840000,
+        "chain": "ethereum",
+        "asset": {
+            "identifier": "1234",
+            "contract": "0x495f947276749ce646f68ac8c248420045cb7b5e",
+        },
+    }
+
+    class API:
+        calls = []
+
+        async def collection_events(self, slug, **kwargs):
+            self.calls.append(slug)
+            return httpx.Response(
+                200, json={"asset_events": [listing, sale], "next": None}
+            )
+
+    stream = make_stream(
+        server,
+        reconnect=RetryPolicy(base=0.01, cap=0.01),
+        gap_filler=GapFiller(API()),
+    )
+    gap_events = []
+
+    @stream.event
+    async def on_gap_event(event):
+        gap_events.append(event)
+
+    await stream.start()
+    await wait_for(lambda: len(server.connections) == 1)
+    await stream.collection("stub")
+    await wait_for(lambda: len(server.joins()) == 1)
+
+    # the listing was received live before the connection dropped
+    await server.broadcast(item_listed())
+    await wait_for(lambda: stream.gap_filler._seen.seen == 1)
+
+    await server.connections.pop().close()
+    await wait_for(lambda: len(stream.outages) == 1)
+    await wait_for(lambda: stream.gap_filler.stats()["gaps"] == 1)
+    await wait_for(lambda: len(gap_events) == 1)
+    await stream.stop()
+
+    assert API.calls == ["stub"]
+    assert server.joins() == ["collection:stub", "collection:stub"]
+    assert gap_events[0].event_type == "sale"
+    assert stream.gap_filler.stats() == {
+        "gaps": 1,
+        "filled": 1,
+        "duplicates": 1,
+        "failed": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_outbox_is_flushed_in_order_after_reconnect(server, monkeypatch):
+    stream = make_stream(server)
+    monkeypatch.setattr(stream.reconnect, "delay", lambda attempt: 0.2)
+    connection = stream.connections[0]
+
+    # queued before the socket is up
+    await stream.collection("a")
+    await stream.collection("b")
+
+    await stream.start()
+    await wait_for(lambda: len(server.joins()) == 2)
+    assert server.joins() == ["collection:a", "collection:b"]
+
+    await server.connections.pop().close()
+    await wait_for(lambda: not connection.ready.is_set())
+
+    await stream.collection("c")
+    await stream.collection("a", sub=False)
+
+    await wait_for(lambda: len(server.received) == 5)
+    await stream.stop()
+
+    ws = server.connections[0]
+    frames = [(msg["event"], msg["topic"]) for ws_, msg in server.received[2:]]
+    assert all(ws_ is ws for ws_, _ in server.received[2:])
+    assert frames == [
+        ("phx_join", "collection:b"),
+        ("phx_join", "collection:c"),
+        ("phx_leave", "collection:a"),
+    ]
+    assert not connection._queued
+
+
+@pytest.mark.asyncio
+async def test_joins_are_acked(server):
+    stream = make_stream(server, join_timeout=0.5)
+    stream.subscriptions.retry = RetryPolicy(max_retries=1, base=0.01, cap=0.01)
+    server.rejected.add("collection:bad")
+
+    await stream.start()
+    slugs = [f"slug-{i}" for i in range(100)]
+    states = await stream.subscribe((s for s in [*slugs, "bad"]), timeout=5)
+
+    assert states.pop("bad") == State.failed
+    assert set(states.values()) == {State.joined}
+
+    # refs are unique, the rejected join was retried once
+    refs = [msg["ref"] for _, msg in server.received]
+    assert len(refs) == len(set(refs)) == 102
+    assert stream.subscriptions["bad"].attempts == 2
+
+    sub = stream.subscriptions["slug-0"]
+    assert sub.latency is not None and sub.latency < 0.5
+    assert stream.subscriptions.stats()["joined"] == 100
+
+    # other instances don't share subscriptions
+    assert "slug-0" not in make_stream(server).subscriptions
+
+    await stream.unsubscribe(slugs)
+    await stream.stop()
+    assert list(stream.subscriptions) == ["bad"]
+
+
+@pytest.mark.asyncio
+async def test_rejoin_after_reconnect(server, monkeypatch):
+    stream = make_stream(server)
+    monkeypatch.setattr(stream.reconnect, "delay", lambda attempt: 0.01)
+
+    await stream.start()
+    await stream.subscribe(["a", "b"], timeout=2)
+    refs = {n: stream.subscriptions[n].ref for n in "ab"}
+
+    await server.connections.pop().close()
+    await wait_for(lambda: len(server.joins()) == 4)
+    states = await stream.subscriptions.wait(timeout=2)
+    await stream.stop()
+
+    assert states == {"a": State.joined, "b": State.joined}
+    assert all(stream.subscriptions[n].ref != refs[n] for n in "ab")
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_batches(server):
+    stream = make_stream(server, batch_size=100, batch_latency=60)
+    batches = []
+
+    @stream.event
+    async def on_item_listed_batch(msgs):
+        batches.append(msgs)
+
+    await stream.start()
+    await wait_for(lambda: len(server.connections) == 1)
+    await server.broadcast(item_listed())
+    await wait_for(lambda: len(stream.batchers["on_item_listed_batch"]) == 1)
+
+    await stream.stop()
+
+    assert len(batches[0]) == 1
+    assert stream.batchers["on_item_listed_batch"]._timer is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_frames_keep_the_connection(server):
+    stream = make_stream(server)
+    received = []
+
+    @stream.event
+    async def on_item_listed(msg):
+        received.append(msg)
+
+    await stream.start()
+    await wait_for(lambda: len(server.connections) == 1)
+
+    unknown = {**item_listed(), "event": "order_invalidate"}
+    for frame in (unknown, unknown, item_listed()):
+        await server.broadcast(frame)
+    await server.connections[0].send("{not json")
+    await server.broadcast(item_listed())
+
+    await wait_for(lambda: len(received) == 2)
+    await stream.stop()
+
+    assert stream.failed_frames == 3
+    assert len(server.connections) == 1
+    assert not stream.outages